@@ -4,20 +4,65 @@ HSBC Little Worker - 主应用程序类
 """
 
 import os
-import json
-import traceback
-from PySide6.QtWidgets import (
-    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-    QToolBar, QStatusBar, QMenuBar, QMenu,
-    QSystemTrayIcon, QMessageBox, QSplitter
-)
-from PySide6.QtCore import Qt, QTimer, Signal
+import sys
+import functools
+from pathlib import Path
+from PySide6.QtWidgets import QMainWindow, QStatusBar, QMenu
+from PySide6.QtCore import QTimer, Signal, Slot
 from PySide6.QtGui import QIcon, QAction
 
-from .plugin_manager import PluginManager
-from .main_window import MainWindow
 from .i18n import get_i18n_manager, tr
 from utils.logger import logger
+from utils.json_utils import json_loads, json_dumps
+
+
+# 项目根目录，打包后的环境使用临时目录
+_PROJECT_ROOT = getattr(sys, '_MEIPASS', None) or os.path.dirname(os.path.dirname(__file__))
+
+# 应用配置文件路径
+_CONFIG_PATH = os.path.normpath(os.path.join(_PROJECT_ROOT, "config", "app_config.json"))
+
+# 应用图标路径
+_ICON_PATH = os.path.normpath(os.path.join(_PROJECT_ROOT, "resources", "icon.svg"))
+_PLUGIN_MANAGER_ICON_PATH = os.path.normpath(os.path.join(_PROJECT_ROOT, "resources", "plugin_manager_icon.svg"))
+
+# 菜单栏使用的翻译键
+_MENU_KEYS = (
+    "menu.file", "menu.settings", "menu.settings.tooltip", "menu.exit",
+    "menu.plugins", "menu.plugin_manager", "menu.language",
+    "menu.help", "menu.welcome", "menu.about",
+)
+
+# 启动阶段使用的静态翻译键
+_STARTUP_KEYS = frozenset({
+    "status.ready", "tray.show", "tray.exit",
+    "app.name", "tray.minimized_message",
+    "about.title", "about.content",
+})
+
+# 插件状态消息模板的翻译键（模板包含{name}占位符）
+_STATUS_KEYS = (
+    "status.plugin_loaded", "status.plugin_unloaded",
+    "status.plugin_enabled", "status.plugin_disabled",
+)
+
+# 菜单标题前缀图标
+_MENU_PREFIXES = {
+    "menu.file": "📁",
+    "menu.plugins": "🔌",
+    "menu.language": "🌐",
+    "menu.help": "🐷",
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _resource_names():
+    """资源目录中的文件名集合（只扫描一次，代替逐个文件的存在性检查）"""
+    try:
+        with os.scandir(os.path.join(_PROJECT_ROOT, "resources")) as entries:
+            return frozenset(entry.name for entry in entries)
+    except FileNotFoundError:
+        return frozenset()
 
 
 class LittleWorkerApp(QMainWindow):
@@ -33,9 +78,17 @@ class LittleWorkerApp(QMainWindow):
         # 初始化国际化管理器
         self.i18n_manager = get_i18n_manager()
         
+        # 应用配置缓存
+        self._config_cache = None
+        self._config_mtime = None  # 缓存对应的配置文件修改时间
+        
         # 加载语言设置
         self.load_language_settings()
         
+        # 预先解析静态文本，语言变更时刷新
+        self._refresh_texts()
+        self.i18n_manager.language_changed.connect(self._refresh_texts)
+        
         # 初始化组件
         self.plugin_manager = None
         self.main_window = None
@@ -44,77 +97,118 @@ class LittleWorkerApp(QMainWindow):
         # 初始化UI
         self._init_ui()
         
-        # 初始化插件管理器
-        self._init_plugin_manager()
-        
-        # 初始化系统托盘
-        self._init_system_tray()
+        # 初始化插件管理器和系统托盘（推迟到事件循环启动后，窗口先完成首次绘制）
+        QTimer.singleShot(0, self._init_plugin_manager)
+        QTimer.singleShot(50, self._init_system_tray)
         
         logger.debug("[STARTUP] 🚀 Application initialized successfully")
     
     def load_language_settings(self):
         """加载语言设置"""
         try:
-            config_path = self._get_config_path()
-            
-            if os.path.exists(config_path):
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
-                    language = config.get("ui_settings", {}).get("language", "en_US")
-                    self.i18n_manager.set_language(language)
-                    # logger.info(f"[SETTINGS] 🌐 Language loaded: {language}")
-            else:
+            # 解析结果缓存在实例上，后续读取应用名称和UI设置时直接复用
+            config = self._read_config()
+            if config is None:
                 logger.warning("[SETTINGS] ⚠️ Config file not found, using default language")
+                return
+            language = config.get("ui_settings", {}).get("language", "en_US")
+            
+            self.i18n_manager.set_language(language)
+            # logger.info(f"[SETTINGS] 🌐 Language loaded: {language}")
                 
+        except FileNotFoundError:
+            logger.warning("[SETTINGS] ⚠️ Config file not found, using default language")
         except Exception as e:
-            logger.error(f"[SETTINGS] ❌ Failed to load language settings: {e} - {traceback.format_exc()}")
+            logger.error("[SETTINGS] ❌ Failed to load language settings: %s", e, exc_info=True)
     
     def _load_ui_settings(self):
         """加载并应用UI设置"""
         try:
-            config_path = self._get_config_path()
+            config = self._read_config()
             
-            if not os.path.exists(config_path):
+            if config is None:
                 logger.warning("[SETTINGS] ⚠️ Config file not found, using default UI settings")
                 return
             
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-                ui_settings = config.get("ui_settings", {})
-                
-                # 应用窗口透明度设置
-                opacity = ui_settings.get("window_opacity", 1.0)
-                self.setWindowOpacity(opacity)
-                logger.debug(f"[SETTINGS] 🔍 Window opacity applied: {int(opacity * 100)}%")
-                
-                # 应用字体大小设置
-                font_size = ui_settings.get("font_size", 11)
-                from PySide6.QtGui import QFont
-                from PySide6.QtWidgets import QApplication
-                font = QApplication.font()
-                font.setPointSize(font_size)
-                QApplication.setFont(font)
-                logger.debug(f"[SETTINGS] 🔤 Font size applied: {font_size}")
-                
-                # 样式功能已移除
-                logger.debug("[SETTINGS] ✅ UI settings loaded")
+            ui_settings = config.get("ui_settings", {})
+            opacity = ui_settings.get("window_opacity", 1.0)
+            font_size = ui_settings.get("font_size", 11)
+            
+            self._apply_ui_settings(opacity, font_size)
+            
+            # 样式功能已移除
+            logger.debug("[SETTINGS] ✅ UI settings loaded")
                 
+        except FileNotFoundError:
+            logger.warning("[SETTINGS] ⚠️ Config file not found, using default UI settings")
         except Exception as e:
-            logger.error(f"[SETTINGS] ❌ Failed to load UI settings: {e} - {traceback.format_exc()}")   
+            logger.error("[SETTINGS] ❌ Failed to load UI settings: %s", e, exc_info=True)   
     
-
+    def _apply_ui_settings(self, opacity, font_size):
+        """应用窗口透明度和字体大小（值未变化时跳过，避免Qt重新计算所有控件样式）"""
+        # 应用窗口透明度设置
+        if abs(self.windowOpacity() - opacity) > 1e-3:
+            self.setWindowOpacity(opacity)
+            logger.debug("[SETTINGS] 🔍 Window opacity applied: %s%%", int(opacity * 100))
+        
+        # 应用字体大小设置
+        from PySide6.QtWidgets import QApplication
+        font = QApplication.font()
+        if font.pointSize() != font_size:
+            font.setPointSize(font_size)
+            QApplication.setFont(font)
+            logger.debug("[SETTINGS] 🔤 Font size applied: %s", font_size)
+    
+    def _refresh_texts(self, language_code=None):
+        """按当前语言批量解析静态文本"""
+        self._t = self.i18n_manager.translate_batch(_STARTUP_KEYS)
+        self._status_templates = self.i18n_manager.translate_batch(_STATUS_KEYS)
+    
+    def _read_config(self):
+        """读取应用配置，解析结果缓存在实例上，配置文件修改时间变化时重新解析
+        
+        Returns:
+            dict: 配置字典，配置文件不存在时返回None
+        """
+        try:
+            mtime = os.stat(_CONFIG_PATH).st_mtime_ns
+            if self._config_cache is None or mtime != self._config_mtime:
+                self._config_cache = json_loads(Path(_CONFIG_PATH).read_bytes())
+                self._config_mtime = mtime
+        except FileNotFoundError:
+            self._config_cache = self._config_mtime = None
+            return None
+        return self._config_cache
+    
+    def _write_config(self, config):
+        """原子写入应用配置，并以写入内容作为新的缓存"""
+        # 确保目录存在
+        os.makedirs(os.path.dirname(_CONFIG_PATH), exist_ok=True)
+        
+        # 先写临时文件再原子替换，避免写入中断导致配置损坏
+        tmp_path = _CONFIG_PATH + ".tmp"
+        Path(tmp_path).write_bytes(json_dumps(config))
+        os.replace(tmp_path, _CONFIG_PATH)
+        
+        self._config_cache = config
+        self._config_mtime = os.stat(_CONFIG_PATH).st_mtime_ns
+    
+    @functools.cached_property
+    def app_icon(self):
+        """应用图标（只加载一次，供窗口和系统托盘共用）"""
+        if "icon.svg" in _resource_names():
+            return QIcon(_ICON_PATH)
+        return QIcon()
     
     def _get_app_name(self):
         """从配置文件获取应用名称"""
         try:
-            config_path = self._get_config_path()
-            
-            if os.path.exists(config_path):
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
-                    return config.get("app_info", {}).get("name", "HSBC Little Worker")
+            config = self._read_config()
+            if config is not None:
+                return config.get("app_info", {}).get("name", "HSBC Little Worker")
+            logger.warning("[SETTINGS] ⚠️ Config file not found: %s", _CONFIG_PATH)
         except Exception as e:
-            logger.error(f"[SETTINGS] ❌ Failed to load app name: {e}")
+            logger.error("[SETTINGS] ❌ Failed to load app name: %s", e)
         
         return "HSBC Little Worker"
     
@@ -126,14 +220,14 @@ class LittleWorkerApp(QMainWindow):
         self.resize(1000, 700)
         
         # 设置窗口图标
-        icon_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "resources", "icon.svg")
-        if os.path.exists(icon_path):
-            self.setWindowIcon(QIcon(icon_path))
+        if not self.app_icon.isNull():
+            self.setWindowIcon(self.app_icon)
         
         # 加载并应用UI设置
         self._load_ui_settings()
         
         # 创建主窗口组件
+        from .main_window import MainWindow
         self.main_window = MainWindow(self)
         self.setCentralWidget(self.main_window)
         
@@ -143,57 +237,99 @@ class LittleWorkerApp(QMainWindow):
         # 创建状态栏
         self._create_status_bar()
         
+        # 窗口显示后空闲时预加载对话框模块，避免首次打开时卡顿
+        QTimer.singleShot(2000, self._preload_dialogs)
+        
         logger.debug("[STARTUP] ✅ Main window initialized")
     
+    def _preload_dialogs(self):
+        """预加载插件管理器和设置对话框模块"""
+        try:
+            from . import plugin_manager_dialog, settings_dialog  # noqa: F401
+            logger.debug("[STARTUP] 📦 Dialog modules preloaded")
+        except ImportError as e:
+            logger.warning("[STARTUP] ⚠️ Failed to preload dialog modules: %s", e)
+    
     def _create_menu_bar(self):
         """创建菜单栏"""
         menubar = self.menuBar()
+        texts = self.i18n_manager.translate_batch(_MENU_KEYS)
+        
+        # 菜单和动作注册表（翻译键 -> QMenu/QAction），用于切换语言时原地更新文本
+        self._action_registry = {}
         
         # 文件菜单
-        file_menu = menubar.addMenu("📁" + tr("menu.file"))
+        file_menu = menubar.addMenu(_MENU_PREFIXES["menu.file"] + texts["menu.file"])
+        self._action_registry["menu.file"] = file_menu
         
         # 设置按钮
-        settings_action = QAction(tr("menu.settings"), self)
-        settings_action.setToolTip(tr("menu.settings.tooltip"))
+        settings_action = QAction(texts["menu.settings"], self)
+        settings_action.setToolTip(texts["menu.settings.tooltip"])
         settings_action.triggered.connect(self._show_settings)
         file_menu.addAction(settings_action)
+        self._action_registry["menu.settings"] = settings_action
 
         # 退出动作
-        exit_action = QAction(tr("menu.exit"), self)
+        exit_action = QAction(texts["menu.exit"], self)
         exit_action.setShortcut("Ctrl+Q")
         exit_action.triggered.connect(self.close)
         file_menu.addAction(exit_action)
+        self._action_registry["menu.exit"] = exit_action
         
         # 插件菜单
-        plugin_menu = menubar.addMenu("🔌" + tr("menu.plugins"))
+        plugin_menu = menubar.addMenu(_MENU_PREFIXES["menu.plugins"] + texts["menu.plugins"])
+        self._action_registry["menu.plugins"] = plugin_menu
         
         # 插件管理动作
-        plugin_manager_action = QAction(tr("menu.plugin_manager"), self)
+        plugin_manager_action = QAction(texts["menu.plugin_manager"], self)
         # 设置插件管理器图标
-        icon_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "resources", "plugin_manager_icon.svg")
-        if os.path.exists(icon_path):
-            plugin_manager_action.setIcon(QIcon(icon_path))
+        if "plugin_manager_icon.svg" in _resource_names():
+            plugin_manager_action.setIcon(QIcon(_PLUGIN_MANAGER_ICON_PATH))
         plugin_manager_action.triggered.connect(self._show_plugin_manager)
         plugin_menu.addAction(plugin_manager_action)
+        self._action_registry["menu.plugin_manager"] = plugin_manager_action
         
         # 语言菜单
-        language_menu = menubar.addMenu("🌐" + tr("menu.language"))
+        language_menu = menubar.addMenu(_MENU_PREFIXES["menu.language"] + texts["menu.language"])
+        self._action_registry["menu.language"] = language_menu
         self._create_language_menu(language_menu)
         
         # 帮助菜单
-        help_menu = menubar.addMenu("🐷" + tr("menu.help"))
+        help_menu = menubar.addMenu(_MENU_PREFIXES["menu.help"] + texts["menu.help"])
+        self._action_registry["menu.help"] = help_menu
         
         # 欢迎页动作
-        welcome_action = QAction(tr("menu.welcome"), self)
+        welcome_action = QAction(texts["menu.welcome"], self)
         welcome_action.triggered.connect(self._show_welcome)
         help_menu.addAction(welcome_action)
+        self._action_registry["menu.welcome"] = welcome_action
         
         help_menu.addSeparator()
         
         # 关于动作
-        about_action = QAction(tr("menu.about"), self)
+        about_action = QAction(texts["menu.about"], self)
         about_action.triggered.connect(self._show_about)
         help_menu.addAction(about_action)
+        self._action_registry["menu.about"] = about_action
+    
+    def _retranslate_menus(self):
+        """按当前语言原地更新菜单栏文本，无需重建菜单"""
+        texts = self.i18n_manager.translate_batch(_MENU_KEYS)
+        
+        for key, widget in self._action_registry.items():
+            # 文本未变化时跳过，避免无谓的菜单重绘
+            if isinstance(widget, QMenu):
+                title = _MENU_PREFIXES.get(key, "") + texts[key]
+                if widget.title() != title:
+                    widget.setTitle(title)
+            elif widget.text() != texts[key]:
+                widget.setText(texts[key])
+        self._action_registry["menu.settings"].setToolTip(texts["menu.settings.tooltip"])
+        
+        # 同步语言菜单的勾选状态
+        current_language = self.i18n_manager.get_current_language()
+        for lang_code, action in self._language_actions.items():
+            action.setChecked(lang_code == current_language)
     
     def _create_status_bar(self):
         """创建状态栏"""
@@ -201,59 +337,63 @@ class LittleWorkerApp(QMainWindow):
         self.setStatusBar(status_bar)
         
         # 显示就绪状态
-        status_bar.showMessage(tr("status.ready"))
+        status_bar.showMessage(self._t["status.ready"])
     
     def _create_language_menu(self, language_menu):
         """创建语言菜单"""
         available_languages = self.i18n_manager.get_available_languages()
         current_language = self.i18n_manager.get_current_language()
+        self._language_actions = {}
         
         for lang_code, lang_name in available_languages.items():
             action = QAction(lang_name, self)
             action.setCheckable(True)
             action.setChecked(lang_code == current_language)
-            action.triggered.connect(lambda checked, code=lang_code: self.change_language(code))
+            action.setData(lang_code)
+            action.triggered.connect(self._on_language_action)
             language_menu.addAction(action)
+            self._language_actions[lang_code] = action
+    
+    @Slot(bool)
+    def _on_language_action(self, checked):
+        """语言菜单动作触发"""
+        action = self.sender()
+        if action is not None:
+            self.change_language(action.data())
     
     def change_language(self, language_code):
         """切换语言"""
         self.i18n_manager.set_language(language_code)
-        # 重新创建菜单栏以更新语言
-        self.menuBar().clear()
-        self._create_menu_bar()
+        # 原地更新菜单栏文本
+        self._retranslate_menus()
         # 保存语言设置
         self._save_language_settings(language_code)
-        logger.info(f"[SETTINGS] 🌐 Language changed to: {language_code}")
+        logger.info("[SETTINGS] 🌐 Language changed to: %s", language_code)
     
     def _save_language_settings(self, language_code):
         """保存语言设置"""
         try:
-            config_path = self._get_config_path()
-            
-            config = {}
-            if os.path.exists(config_path):
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
-            
-            if "ui_settings" not in config:
-                config["ui_settings"] = {}
+            config = self._read_config() or {}
+            ui_settings = config.get("ui_settings", {})
             
-            config["ui_settings"]["language"] = language_code
-            
-            # 确保目录存在
-            os.makedirs(os.path.dirname(config_path), exist_ok=True)
+            # 语言未变化时无需写盘
+            if ui_settings.get("language") == language_code:
+                return
             
-            with open(config_path, 'w', encoding='utf-8') as f:
-                json.dump(config, f, ensure_ascii=False, indent=2)
+            # 在副本上修改，写入失败时缓存仍与文件内容一致
+            new_config = {**config, "ui_settings": {**ui_settings, "language": language_code}}
+            self._write_config(new_config)
                 
-            logger.info(f"[SETTINGS] 💾 Language settings saved: {language_code}")
+            logger.info("[SETTINGS] 💾 Language settings saved: %s", language_code)
             
         except Exception as e:
-            logger.error(f"[SETTINGS] ❌ Failed to save language settings: {e} - {traceback.format_exc()}")
+            logger.error("[SETTINGS] ❌ Failed to save language settings: %s", e, exc_info=True)
     
     def _init_plugin_manager(self):
         """初始化插件管理器"""
         try:
+            from .plugin_manager import PluginManager
+            
             self.plugin_manager = PluginManager(self)
             
             # 连接插件信号
@@ -262,14 +402,12 @@ class LittleWorkerApp(QMainWindow):
             self.plugin_manager.plugin_enabled.connect(self._on_plugin_enabled)
             self.plugin_manager.plugin_disabled.connect(self._on_plugin_disabled)
             
-            # 加载插件
+            # 加载插件（后台导入，全部加载完成后同步插件按钮状态）
+            self.plugin_manager.plugins_loaded.connect(self._sync_plugin_button_states)
             self.plugin_manager.load_plugins()
             
-            # 同步插件按钮状态
-            self._sync_plugin_button_states()
-            
         except Exception as e:
-            logger.error(f"[PLUGIN] ❌ Plugin manager initialization failed: {e} - {traceback.format_exc()}")
+            logger.error("[PLUGIN] ❌ Plugin manager initialization failed: %s", e, exc_info=True)
     
     def _sync_plugin_button_states(self):
         """同步插件按钮状态与插件启用状态"""
@@ -277,31 +415,27 @@ class LittleWorkerApp(QMainWindow):
             if not self.main_window or not hasattr(self.main_window, 'plugin_buttons'):
                 return
             
-            # 获取所有可用插件的信息
-            available_plugins = self.plugin_manager.discover_plugins()
+            # 已启用插件集合由插件管理器在内存中维护，无需重新发现插件
+            enabled_plugins = self.plugin_manager.get_enabled_plugins()
             
-            # 创建插件启用状态映射
-            plugin_enabled_map = {}
-            for plugin_info in available_plugins:
-                plugin_enabled_map[plugin_info['name']] = plugin_info.get('enabled', False)
-            
-            # 遍历所有插件按钮，根据enabled状态设置样式
-            for plugin_name, button in self.main_window.plugin_buttons.items():
-                is_enabled = plugin_enabled_map.get(plugin_name, False)
-                if is_enabled:
+            # 遍历所有插件按钮，根据enabled状态设置样式（状态未变化的按钮会被跳过）
+            for plugin_name in self.main_window.plugin_buttons:
+                if plugin_name in enabled_plugins:
                     # 插件已启用，使用正常样式
                     self.main_window.enable_plugin_button(plugin_name)
                 else:
                     # 插件未启用，使用灰色样式
                     self.main_window.disable_plugin_button(plugin_name)
             
-            logger.info(f"[PLUGIN] 🔄 Plugin button states synchronized based on enabled status")
+            logger.info("[PLUGIN] 🔄 Plugin button states synchronized based on enabled status")
             
         except Exception as e:
-            logger.error(f"[PLUGIN] ❌ Failed to sync plugin button states: {e} - {traceback.format_exc()}")
+            logger.error("[PLUGIN] ❌ Failed to sync plugin button states: %s", e, exc_info=True)
     
     def _init_system_tray(self):
         """初始化系统托盘"""
+        from PySide6.QtWidgets import QSystemTrayIcon
+        
         if not QSystemTrayIcon.isSystemTrayAvailable():
             logger.warning("[SYSTEM] ⚠️ System tray unavailable")
             return
@@ -311,24 +445,23 @@ class LittleWorkerApp(QMainWindow):
             self.system_tray = QSystemTrayIcon(self)
             
             # 设置托盘图标 - 支持打包环境
-            icon_path = self._get_resource_path("icon.svg")
-            if icon_path and os.path.exists(icon_path):
-                self.system_tray.setIcon(QIcon(icon_path))
+            if not self.app_icon.isNull():
+                self.system_tray.setIcon(self.app_icon)
             else:
-                logger.warning(f"[SYSTEM] ⚠️ System tray icon not found: {icon_path}")
+                logger.warning("[SYSTEM] ⚠️ System tray icon not found: %s", _ICON_PATH)
             
             # 创建托盘菜单
             tray_menu = QMenu()
             
             # 显示主窗口
-            show_action = QAction(tr("tray.show"), self)
+            show_action = QAction(self._t["tray.show"], self)
             show_action.triggered.connect(self.show)
             tray_menu.addAction(show_action)
             
             tray_menu.addSeparator()
             
             # 退出应用
-            quit_action = QAction(tr("tray.exit"), self)
+            quit_action = QAction(self._t["tray.exit"], self)
             quit_action.triggered.connect(self._quit_application)
             tray_menu.addAction(quit_action)
             
@@ -341,66 +474,38 @@ class LittleWorkerApp(QMainWindow):
             logger.info("[SYSTEM] 📱 System tray initialized")
             
         except Exception as e:
-            logger.error(f"[SYSTEM] ❌ System tray initialization failed: {e} - {traceback.format_exc()}")
-    
-    def _get_resource_path(self, filename):
-        """获取资源文件路径，支持打包后的环境"""
-        import sys
-        from pathlib import Path
-        
-        if getattr(sys, 'frozen', False):
-            # 打包后的环境：使用临时目录中的资源
-            base_path = Path(sys._MEIPASS)
-        else:
-            # 开发环境：使用相对路径
-            base_path = Path(__file__).parent.parent
-        
-        resource_path = base_path / "resources" / filename
-        return str(resource_path)
-    
-    def _get_config_path(self, filename="app_config.json"):
-        """获取配置文件路径，支持打包后的环境"""
-        import sys
-        from pathlib import Path
-        
-        if getattr(sys, 'frozen', False):
-            # 打包后的环境：使用临时目录中的配置
-            base_path = Path(sys._MEIPASS)
-        else:
-            # 开发环境：使用相对路径
-            base_path = Path(__file__).parent.parent
-        
-        config_path = base_path / "config" / filename
-        return str(config_path)
+            logger.error("[SYSTEM] ❌ System tray initialization failed: %s", e, exc_info=True)
     
     def _on_plugin_loaded(self, plugin_name):
         """插件加载完成回调"""
-        self.statusBar().showMessage(tr("status.plugin_loaded").format(name=plugin_name), 3000)
+        self.statusBar().showMessage(self._status_templates["status.plugin_loaded"].format_map({"name": plugin_name}), 3000)
         self.plugin_loaded.emit(plugin_name)
-        logger.debug(f"[PLUGIN] 🔌 Plugin loaded: {plugin_name}")
+        logger.debug("[PLUGIN] 🔌 Plugin loaded: %s", plugin_name)
     
     def _on_plugin_unloaded(self, plugin_name):
         """插件卸载完成回调"""
-        self.statusBar().showMessage(tr("status.plugin_unloaded").format(name=plugin_name), 3000)
+        self.statusBar().showMessage(self._status_templates["status.plugin_unloaded"].format_map({"name": plugin_name}), 3000)
         self.plugin_unloaded.emit(plugin_name)
-        logger.debug(f"[PLUGIN] 🔌 Plugin unloaded: {plugin_name}")
+        logger.debug("[PLUGIN] 🔌 Plugin unloaded: %s", plugin_name)
     
     def _on_plugin_enabled(self, plugin_name):
         """插件启用回调"""
-        self.statusBar().showMessage(tr("status.plugin_enabled").format(name=plugin_name), 3000)
+        self.statusBar().showMessage(self._status_templates["status.plugin_enabled"].format_map({"name": plugin_name}), 3000)
         # 同步插件按钮状态
         self._sync_plugin_button_states()
-        logger.debug(f"[PLUGIN] ✅ Plugin enabled: {plugin_name}")
+        logger.debug("[PLUGIN] ✅ Plugin enabled: %s", plugin_name)
     
     def _on_plugin_disabled(self, plugin_name):
         """插件禁用回调"""
-        self.statusBar().showMessage(tr("status.plugin_disabled").format(name=plugin_name), 3000)
+        self.statusBar().showMessage(self._status_templates["status.plugin_disabled"].format_map({"name": plugin_name}), 3000)
         # 同步插件按钮状态
         self._sync_plugin_button_states()
-        logger.debug(f"[PLUGIN] ❌ Plugin disabled: {plugin_name}")
+        logger.debug("[PLUGIN] ❌ Plugin disabled: %s", plugin_name)
     
     def _on_tray_activated(self, reason):
         """系统托盘激活事件"""
+        from PySide6.QtWidgets import QSystemTrayIcon
+        
         if reason == QSystemTrayIcon.DoubleClick:
             if self.isVisible():
                 self.hide()
@@ -432,6 +537,8 @@ class LittleWorkerApp(QMainWindow):
     
     def _show_plugin_manager(self):
         """显示插件管理器"""
+        from PySide6.QtWidgets import QMessageBox
+        
         try:
             from .plugin_manager_dialog import PluginManagerDialog
             
@@ -443,16 +550,18 @@ class LittleWorkerApp(QMainWindow):
             dialog.exec()
             
         except ImportError as e:
-            logger.error(f"[PLUGIN_MANAGER] ❌ Failed to import plugin manager dialog: {e}")
+            logger.error("[PLUGIN_MANAGER] ❌ Failed to import plugin manager dialog: %s", e)
             QMessageBox.warning(self, tr("plugin_manager.error"), tr("plugin_manager.dialog_error"))
         except Exception as e:
-            logger.error(f"[PLUGIN_MANAGER] ❌ Error showing plugin manager: {e}")
+            logger.error("[PLUGIN_MANAGER] ❌ Error showing plugin manager: %s", e)
             QMessageBox.warning(self, tr("plugin_manager.error"), str(e))
         
         logger.debug("[ACTION] 🔧 Show plugin manager")
     
     def _show_settings(self):
         """显示设置对话框"""
+        from PySide6.QtWidgets import QMessageBox
+        
         try:
             from .settings_dialog import SettingsDialog
             
@@ -472,18 +581,46 @@ class LittleWorkerApp(QMainWindow):
         
         logger.debug("[ACTION] ⚙️ Show settings dialog")
     
-    def _on_settings_changed(self):
-        """设置变更时的处理"""
-        # 重新加载并应用UI设置（包括主题样式）
-        self._load_ui_settings()
+    def _on_settings_changed(self, new_settings):
+        """设置变更时的处理
         
-        # 重新创建菜单栏以更新语言
-        self.menuBar().clear()
-        self._create_menu_bar()
+        Args:
+            new_settings: 设置对话框提交的ui_settings字典
+        """
+        try:
+            config = self._read_config() or {}
+        except Exception as e:
+            logger.error("[SETTINGS] ❌ Failed to load config: %s", e, exc_info=True)
+            config = {}
+        ui_settings = config.get("ui_settings", {})
         
-        # 通知主窗口刷新样式
-        if self.main_window:
-            self.main_window.update()
+        # 只处理实际发生变化的设置项
+        changed = {key for key, value in new_settings.items() if ui_settings.get(key) != value}
+        if not changed:
+            logger.debug("[ACTION] ⚙️ Settings unchanged")
+            return
+        
+        # 直接应用新设置，无需重新读取配置文件
+        if changed & {"window_opacity", "font_size"}:
+            self._apply_ui_settings(
+                new_settings.get("window_opacity", 1.0),
+                new_settings.get("font_size", 11)
+            )
+            # 通知主窗口刷新样式
+            if self.main_window:
+                self.main_window.update()
+        
+        # 更新菜单栏语言
+        if "language" in changed:
+            self._retranslate_menus()
+        
+        # 在缓存配置的副本上合并并一次性写回，写入失败时缓存仍与文件内容一致
+        try:
+            new_config = {**config, "ui_settings": {**ui_settings, **new_settings}}
+            self._write_config(new_config)
+            logger.info("[SETTINGS] 💾 Settings saved: %s", ', '.join(sorted(changed)))
+        except Exception as e:
+            logger.error("[SETTINGS] ❌ Failed to save settings: %s", e, exc_info=True)
         
         logger.debug("[ACTION] ⚙️ Settings change handled")
     
@@ -495,10 +632,12 @@ class LittleWorkerApp(QMainWindow):
     
     def _show_about(self):
         """显示关于对话框"""
+        from PySide6.QtWidgets import QMessageBox
+        
         QMessageBox.about(
             self,
-            tr("about.title"),
-            tr("about.content")
+            self._t["about.title"],
+            self._t["about.content"]
         )
     
     def _quit_application(self):
@@ -526,9 +665,10 @@ class LittleWorkerApp(QMainWindow):
             if hasattr(self, '_first_hide'):
                 return
             
+            from PySide6.QtWidgets import QSystemTrayIcon
             self.system_tray.showMessage(
-                tr("app.name"),
-                tr("tray.minimized_message"),
+                self._t["app.name"],
+                self._t["tray.minimized_message"],
                 QSystemTrayIcon.Information,
                 2000
             )
@@ -5,11 +5,43 @@
 """
 
 import os
-import json
+import sys
+from pathlib import Path
 from typing import Dict, Optional
 from PySide6.QtCore import QObject, Signal, QLocale, QTranslator, QCoreApplication
 from PySide6.QtWidgets import QApplication
 from utils.logger import logger
+from utils.json_utils import json_loads, json_dumps
+
+
+# 翻译文件目录
+_TRANSLATIONS_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "resources",
+    "translations"
+)
+
+# 长度小于此值的翻译文本才驻留，长段落不进入驻留表
+_INTERN_MAX_LEN = 64
+
+
+def intern_translations(translations: Dict[str, str]) -> Dict[str, str]:
+    """驻留翻译字典的键和较短的文本
+    
+    键与代码中的字符串常量（已驻留）为同一对象时，字典查找可直接按指针命中。
+    
+    Args:
+        translations: 从翻译文件解析出的字典
+        
+    Returns:
+        Dict[str, str]: 键和短文本已驻留的新字典
+    """
+    intern = sys.intern
+    return {
+        intern(key): intern(value) if isinstance(value, str) and len(value) < _INTERN_MAX_LEN else value
+        for key, value in translations.items()
+    }
+
 
 class I18nManager(QObject):
     """国际化管理器"""
@@ -21,35 +53,35 @@ class I18nManager(QObject):
         super().__init__()
         self.current_language = "en_US"  # 默认英文
         self.translations: Dict[str, Dict[str, str]] = {}
+        self._active: Optional[Dict[str, str]] = None  # 当前语言的扁平查找表（含已解析的英文回退）
         self.plugin_translations: Dict[str, Dict[str, Dict[str, str]]] = {}  # 插件翻译缓存
-        self.translator = QTranslator()
+        self._translator: Optional[QTranslator] = None  # Qt翻译器，首次切换语言时创建
         self.available_languages = {
             "zh_CN": "简体中文",
             "en_US": "English"
         }
         
         # 翻译文件目录
-        self.translations_dir = os.path.join(
-            os.path.dirname(os.path.dirname(__file__)), 
-            "resources", 
-            "translations"
-        )
+        self.translations_dir = _TRANSLATIONS_DIR
         
-        # 确保翻译目录存在
-        os.makedirs(self.translations_dir, exist_ok=True)
-        
-        # 加载翻译文件
-        self.load_translations()
+        # 翻译文件按语言在首次使用时加载，翻译目录在保存时才创建
         
         # 设置默认语言
         # self.set_language(self.detect_system_language())
     
+    @property
+    def translator(self) -> QTranslator:
+        """Qt翻译器（延迟创建）"""
+        if self._translator is None:
+            self._translator = QTranslator()
+        return self._translator
+    
     def detect_system_language(self) -> str:
         """检测系统语言"""
-        system_locale = QLocale.system().name()
-        if system_locale.startswith("zh"):
+        system_language = QLocale.system().language()
+        if system_language == QLocale.Chinese:
             return "zh_CN"
-        elif system_locale.startswith("en"):
+        elif system_language == QLocale.English:
             return "en_US"
         else:
             return "zh_CN"  # 默认中文
@@ -57,26 +89,41 @@ class I18nManager(QObject):
     def load_translations(self):
         """加载所有翻译文件"""
         for lang_code in self.available_languages.keys():
+            self._ensure_loaded(lang_code)
+    
+    def _ensure_loaded(self, lang_code: str) -> Dict[str, str]:
+        """确保指定语言的翻译文件已加载（每种语言只读取一次）
+        
+        Args:
+            lang_code: 语言代码
+            
+        Returns:
+            Dict[str, str]: 该语言的翻译字典
+        """
+        translations = self.translations.get(lang_code)
+        if translations is None:
             translation_file = os.path.join(self.translations_dir, f"{lang_code}.json")
-            if os.path.exists(translation_file):
-                try:
-                    with open(translation_file, 'r', encoding='utf-8') as f:
-                        self.translations[lang_code] = json.load(f)
-                except Exception as e:
-                    logger.error(f"Failed to load translation file {translation_file}: {e}")
-                    self.translations[lang_code] = {}
-            else:
-                self.translations[lang_code] = {}
+            try:
+                translations = intern_translations(json_loads(Path(translation_file).read_bytes()))
+            except FileNotFoundError:
+                translations = {}
+            except Exception as e:
+                logger.error(f"Failed to load translation file {translation_file}: {e}")
+                translations = {}
+            self.translations[lang_code] = translations
+        return translations
     
     def set_language(self, language_code: str):
         """设置当前语言"""
         if language_code in self.available_languages:
             self.current_language = language_code
+            self._active = None
             
             # 安装Qt翻译器
             app = QApplication.instance()
             if app:
-                app.removeTranslator(self.translator)
+                if self._translator is not None:
+                    app.removeTranslator(self._translator)
                 
                 # 加载Qt内置翻译
                 qt_translation_file = f"qt_{language_code}"
@@ -94,35 +141,63 @@ class I18nManager(QObject):
         """获取可用语言列表"""
         return self.available_languages.copy()
     
+    def _active_translations(self) -> Dict[str, str]:
+        """获取当前语言的扁平查找表，切换语言后首次使用时重建"""
+        if self._active is None:
+            current = self._ensure_loaded(self.current_language)
+            self._active = {key: value for key, value in current.items() if value}
+        return self._active
+    
+    def _resolve_fallback(self, key: str) -> Optional[str]:
+        """从英文翻译中解析缺失的键，命中后写入查找表"""
+        if self.current_language == "en_US":
+            return None
+        translation = self._ensure_loaded("en_US").get(key)
+        if translation:
+            self._active[key] = translation
+        return translation or None
+    
     def tr(self, key: str, default: Optional[str] = None) -> str:
         """翻译文本"""
-        if self.current_language in self.translations:
-            translation = self.translations[self.current_language].get(key)
-            if translation:
-                return translation
-        
-        # 如果当前语言没有翻译，尝试使用英文
-        if self.current_language != "en_US" and "en_US" in self.translations:
-            translation = self.translations["en_US"].get(key)
-            if translation:
-                return translation
+        active = self._active if self._active is not None else self._active_translations()
+        translation = active.get(key)
+        if translation is None:
+            # 当前语言没有翻译时回退到英文，命中后不再重复查找
+            translation = self._resolve_fallback(key)
+            if translation is None:
+                # 返回默认值或键名
+                return default if default is not None else key
+        return translation
+    
+    def translate_batch(self, keys) -> Dict[str, str]:
+        """批量翻译文本
         
-        # 返回默认值或键名
-        return default if default is not None else key
+        Args:
+            keys: 翻译键名序列
+            
+        Returns:
+            Dict[str, str]: 键名到翻译文本的映射，回退规则与tr()一致
+        """
+        return {key: self.tr(key) for key in keys}
     
     def add_translation(self, language_code: str, key: str, value: str):
         """添加翻译"""
-        if language_code not in self.translations:
-            self.translations[language_code] = {}
-        self.translations[language_code][key] = value
+        # 先加载已有翻译，避免保存时覆盖文件中的其他条目
+        self._ensure_loaded(language_code)[key] = value
+        self._active = None
     
     def save_translations(self):
         """保存翻译文件"""
         for lang_code, translations in self.translations.items():
             translation_file = os.path.join(self.translations_dir, f"{lang_code}.json")
             try:
-                with open(translation_file, 'w', encoding='utf-8') as f:
-                    json.dump(translations, f, ensure_ascii=False, indent=2)
+                data = json_dumps(translations)
+                try:
+                    Path(translation_file).write_bytes(data)
+                except FileNotFoundError:
+                    # 翻译目录不存在时才创建
+                    os.makedirs(self.translations_dir, exist_ok=True)
+                    Path(translation_file).write_bytes(data)
             except Exception as e:
                 logger.error(f"Failed to save translation file {translation_file}: {e}")
     
@@ -140,8 +215,7 @@ class I18nManager(QObject):
             translation_file = os.path.join(translations_dir, f"{lang_code}.json")
             if os.path.exists(translation_file):
                 try:
-                    with open(translation_file, 'r', encoding='utf-8') as f:
-                        plugin_translations[lang_code] = json.load(f)
+                    plugin_translations[lang_code] = intern_translations(json_loads(Path(translation_file).read_bytes()))
                 except Exception as e:
                     logger.error(f"Failed to load plugin translation file {translation_file}: {e}")
                     plugin_translations[lang_code] = {}
@@ -178,15 +252,20 @@ _i18n_manager = None
 
 def get_i18n_manager() -> I18nManager:
     """获取国际化管理器实例"""
-    global _i18n_manager
+    global _i18n_manager, tr
     if _i18n_manager is None:
         _i18n_manager = I18nManager()
+        # 之后导入的tr直接是实例的绑定方法，省去每次调用的间接查找
+        tr = _i18n_manager.tr
     return _i18n_manager
 
 
 def tr(key: str, default: Optional[str] = None) -> str:
-    """翻译文本的便捷函数"""
-    return get_i18n_manager().tr(key, default)
+    """翻译文本的便捷函数（在实例创建前导入的模块使用此函数）"""
+    manager = _i18n_manager
+    if manager is None:
+        manager = get_i18n_manager()
+    return manager.tr(key, default)
 
 
 def set_language(language_code: str):
@@ -199,5 +278,8 @@ def get_current_language() -> str:
     return get_i18n_manager().get_current_language()
 
 
-# 全局国际化管理器实例
-i18n_manager = get_i18n_manager()
\ No newline at end of file
+def __getattr__(name: str):
+    """模块属性延迟解析：首次访问i18n_manager时才创建全局实例"""
+    if name == "i18n_manager":
+        return get_i18n_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -3,16 +3,36 @@
 HSBC Little Worker - 主窗口类
 """
 
+import sys
+import weakref
+import functools
+
 from PySide6.QtWidgets import (
-    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QTabWidget,
-    QSplitter, QFrame, QLabel, QPushButton, QScrollArea,
-    QGridLayout, QGroupBox, QSizePolicy, QMenu
+    QWidget, QVBoxLayout, QTabWidget,
+    QSplitter, QFrame, QLabel, QPushButton, QScrollArea
 )
-from PySide6.QtCore import Qt, Signal, QSize
+from PySide6.QtCore import Qt, Signal, Slot
 from PySide6.QtGui import QFont
 
 from utils.logger import logger
-from .i18n import get_i18n_manager, tr
+from .i18n import get_i18n_manager
+
+
+# 主窗口使用的静态翻译键
+_STATIC_KEYS = (
+    "app.title", "app.subtitle",
+    "plugins.available", "plugins.none_available",
+    "tab.welcome", "welcome.title", "welcome.description",
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _font(point_size, bold=False):
+    """获取共享的字体实例（按字号和粗细缓存，需在QApplication创建后调用）"""
+    font = QFont()
+    font.setPointSize(point_size)
+    font.setBold(bold)
+    return font
 
 
 class MainWindow(QWidget):
@@ -24,13 +44,27 @@ class MainWindow(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         
+        # 父窗口弱引用及其回调方法缓存（回调名称 -> WeakMethod）
+        self._parent_ref = weakref.ref(parent) if parent is not None else None
+        self._parent_callbacks = {}
+        
         # 存储插件界面
         self.plugin_widgets = {}
+        # 插件界面 -> 插件名称的反向索引，关闭标签页时直接查找
+        self._plugin_name_by_widget = {}
         # 存储插件按钮
         self.plugin_buttons = {}
+        # 插件按钮当前的启用样式状态，状态未变化时跳过样式刷新
+        self.plugin_button_states = {}
+        # 翻译键 -> 标签控件，语言变更时统一更新
+        self._i18n_bindings = {}
+        # 欢迎页控件，关闭标签页后保留以便重新显示时复用
+        self._welcome_widget = None
         
         # 获取国际化管理器
         self.i18n_manager = get_i18n_manager()
+        # 当前语言下的静态文本（翻译键 -> 文本），语言变更时整体刷新
+        self._t = self.i18n_manager.translate_batch(_STATIC_KEYS)
         
         # 初始化UI
         self._init_ui()
@@ -66,23 +100,20 @@ class MainWindow(QWidget):
         layout.setContentsMargins(20, 15, 20, 15)
         
         # 标题
-        self.title_label = QLabel(tr("app.title"))
-        title_font = QFont()
-        title_font.setPointSize(18)
-        title_font.setBold(True)
-        self.title_label.setFont(title_font)
+        self.title_label = QLabel(self._t["app.title"])
+        self.title_label.setFont(_font(18, bold=True))
         self.title_label.setAlignment(Qt.AlignCenter)
         self.title_label.setObjectName("welcome-title")
         layout.addWidget(self.title_label)
+        self._i18n_bindings["app.title"] = self.title_label
         
         # 副标题
-        self.subtitle_label = QLabel(tr("app.subtitle"))
-        subtitle_font = QFont()
-        subtitle_font.setPointSize(10)
-        self.subtitle_label.setFont(subtitle_font)
+        self.subtitle_label = QLabel(self._t["app.subtitle"])
+        self.subtitle_label.setFont(_font(10))
         self.subtitle_label.setAlignment(Qt.AlignCenter)
         self.subtitle_label.setObjectName("welcome-subtitle")
         layout.addWidget(self.subtitle_label)
+        self._i18n_bindings["app.subtitle"] = self.subtitle_label
         
         return welcome_frame
     
@@ -119,13 +150,11 @@ class MainWindow(QWidget):
         layout.setSpacing(5)
         
         # 标题
-        self.plugin_list_title = QLabel(tr("plugins.available"))
+        self.plugin_list_title = QLabel(self._t["plugins.available"])
         self.plugin_list_title.setObjectName("plugin-list-title")
-        title_font = QFont()
-        title_font.setPointSize(10)
-        title_font.setBold(True)
-        self.plugin_list_title.setFont(title_font)
+        self.plugin_list_title.setFont(_font(10, bold=True))
         layout.addWidget(self.plugin_list_title)
+        self._i18n_bindings["plugins.available"] = self.plugin_list_title
         
         # 创建滚动区域
         scroll_area = QScrollArea()
@@ -139,10 +168,11 @@ class MainWindow(QWidget):
         self.plugin_buttons_layout.setSpacing(5)
         
         # 添加默认提示
-        self.no_plugins_label = QLabel(tr("plugins.none_available"))
+        self.no_plugins_label = QLabel(self._t["plugins.none_available"])
         self.no_plugins_label.setAlignment(Qt.AlignCenter)
         self.no_plugins_label.setObjectName("no-plugins-text")
         self.plugin_buttons_layout.addWidget(self.no_plugins_label)
+        self._i18n_bindings["plugins.none_available"] = self.no_plugins_label
         
         # 添加弹性空间
         self.plugin_buttons_layout.addStretch()
@@ -161,8 +191,8 @@ class MainWindow(QWidget):
         self.tab_widget.tabCloseRequested.connect(self._close_plugin_tab)
         
         # 添加默认欢迎页
-        welcome_tab = self._create_welcome_tab()
-        self.welcome_tab_index = self.tab_widget.addTab(welcome_tab, tr("tab.welcome"))
+        self._welcome_widget = self._create_welcome_tab()
+        self.tab_widget.addTab(self._welcome_widget, self._t["tab.welcome"])
         
         return self.tab_widget
     
@@ -174,16 +204,14 @@ class MainWindow(QWidget):
         layout.setSpacing(20)
         
         # 大标题
-        self.welcome_title = QLabel(tr("welcome.title"))
-        title_font = QFont()
-        title_font.setPointSize(18)
-        title_font.setBold(True)
-        self.welcome_title.setFont(title_font)
+        self.welcome_title = QLabel(self._t["welcome.title"])
+        self.welcome_title.setFont(_font(18, bold=True))
         self.welcome_title.setAlignment(Qt.AlignCenter)
         layout.addWidget(self.welcome_title)
+        self._i18n_bindings["welcome.title"] = self.welcome_title
         
         # 描述文本
-        self.welcome_desc = QLabel(tr("welcome.description"))
+        self.welcome_desc = QLabel(self._t["welcome.description"])
         self.welcome_desc.setAlignment(Qt.AlignCenter)
         self.welcome_desc.setWordWrap(True)
         self.welcome_desc.setTextFormat(Qt.RichText)  # 启用富文本格式
@@ -191,6 +219,7 @@ class MainWindow(QWidget):
         self.welcome_desc.setTextInteractionFlags(Qt.TextBrowserInteraction)  # 允许文本交互
         self.welcome_desc.setObjectName("welcome-description")
         layout.addWidget(self.welcome_desc)
+        self._i18n_bindings["welcome.description"] = self.welcome_desc
         
         # 添加弹性空间
         layout.addStretch()
@@ -202,25 +231,40 @@ class MainWindow(QWidget):
         # 样式现在由QSS文件统一管理
         pass
     
+    def begin_bulk_add(self):
+        """开始批量添加插件按钮，暂停插件列表的重绘"""
+        self.plugin_buttons_widget.setUpdatesEnabled(False)
+    
+    def end_bulk_add(self):
+        """结束批量添加插件按钮，恢复重绘并统一更新一次布局"""
+        self.plugin_buttons_widget.setUpdatesEnabled(True)
+        self.plugin_buttons_widget.updateGeometry()
+    
     def add_plugin_button(self, plugin_name, plugin_display_name, plugin_description=""):
         """添加插件按钮"""
-        logger.debug(f"[PLUGIN] 🔌 Adding plugin button: {plugin_display_name}")
+        # 插件名称作为多个字典的键频繁查找，驻留后比较只需判断引用
+        plugin_name = sys.intern(plugin_name)
+        logger.debug("[PLUGIN] 🔌 Adding plugin button: %s", plugin_display_name)
         
         # 移除默认提示（如果存在）
         if hasattr(self, 'no_plugins_label') and self.no_plugins_label:
             self.plugin_buttons_layout.removeWidget(self.no_plugins_label)
             self.no_plugins_label.deleteLater()
             self.no_plugins_label = None
+            self._i18n_bindings.pop("plugins.none_available", None)
 
         
         # 创建插件按钮
         button = QPushButton(plugin_display_name)
         button.setToolTip(plugin_description or f"打开 {plugin_display_name}")
-        button.clicked.connect(lambda: self._open_plugin(plugin_name, plugin_display_name))
+        button.setProperty("plugin_name", plugin_name)
+        button.setProperty("plugin_display_name", plugin_display_name)
+        button.clicked.connect(self._on_plugin_button_clicked)
         
         # 设置按钮样式
         button.setMinimumHeight(40)
         button.setObjectName("plugin-button")
+        button.setProperty("state", "normal")
         
         # 存储插件按钮引用
         self.plugin_buttons[plugin_name] = button
@@ -231,53 +275,60 @@ class MainWindow(QWidget):
             button
         )
     
+    @Slot()
+    def _on_plugin_button_clicked(self):
+        """插件按钮点击事件"""
+        button = self.sender()
+        self._open_plugin(button.property("plugin_name"), button.property("plugin_display_name"))
+    
     def _open_plugin(self, plugin_name, plugin_display_name):
         """打开插件"""
         # 检查是否已经打开
-        for i in range(self.tab_widget.count()):
-            if self.tab_widget.tabText(i) == plugin_display_name:
-                self.tab_widget.setCurrentIndex(i)
+        widget = self.plugin_widgets.get(plugin_name)
+        if widget is not None:
+            index = self.tab_widget.indexOf(widget)
+            if index >= 0:
+                self.tab_widget.setCurrentIndex(index)
                 return
         
         # 发送请求插件界面信号
         self.plugin_widget_requested.emit(plugin_name)
         
-        logger.debug(f"[PLUGIN] 🚀 Opening plugin: {plugin_name}")
+        logger.debug("[PLUGIN] 🚀 Opening plugin: %s", plugin_name)
     
     def add_plugin_widget(self, plugin_name, plugin_display_name, widget):
         """添加插件界面"""
         if widget is None:
-            logger.warning(f"[PLUGIN] ⚠️ Plugin {plugin_name} returned empty widget")
+            logger.warning("[PLUGIN] ⚠️ Plugin %s returned empty widget", plugin_name)
             return
         
         # 存储插件界面
+        plugin_name = sys.intern(plugin_name)
         self.plugin_widgets[plugin_name] = widget
+        self._plugin_name_by_widget[widget] = plugin_name
         
         # 添加到标签页
         index = self.tab_widget.addTab(widget, plugin_display_name)
         self.tab_widget.setCurrentIndex(index)
         
-        logger.debug(f"[PLUGIN] 📋 Plugin widget added: {plugin_display_name}")
+        logger.debug("[PLUGIN] 📋 Plugin widget added: %s", plugin_display_name)
     
+    @Slot(int)
     def _close_plugin_tab(self, index):
         """关闭插件标签页"""
         # if index == 0:
         #     return
         
         tab_text = self.tab_widget.tabText(index)
+        widget = self.tab_widget.widget(index)
         self.tab_widget.removeTab(index)
         
         # 从存储中移除
-        plugin_name = None
-        for name, widget in self.plugin_widgets.items():
-            if widget == self.tab_widget.widget(index):
-                plugin_name = name
-                break
-        
+        plugin_name = self._plugin_name_by_widget.pop(widget, None)
         if plugin_name:
             del self.plugin_widgets[plugin_name]
         
-        logger.debug(f"[PLUGIN] ❌ Plugin tab closed: {tab_text}")
+        logger.debug("[PLUGIN] ❌ Plugin tab closed: %s", tab_text)
     
     def remove_plugin_button(self, plugin_name):
         """移除插件按钮"""
@@ -286,78 +337,90 @@ class MainWindow(QWidget):
             self.plugin_buttons_layout.removeWidget(button)
             button.deleteLater()
             del self.plugin_buttons[plugin_name]
-            logger.debug(f"[PLUGIN] 🗑️ Plugin button removed: {plugin_name}")
+            self.plugin_button_states.pop(plugin_name, None)
+            logger.debug("[PLUGIN] 🗑️ Plugin button removed: %s", plugin_name)
             
             # 如果没有插件按钮了，显示默认提示
             if not self.plugin_buttons:
-                self.no_plugins_label = QLabel(tr("plugins.none_available"))
+                self.no_plugins_label = QLabel(self._t["plugins.none_available"])
                 self.no_plugins_label.setAlignment(Qt.AlignCenter)
                 self.no_plugins_label.setObjectName("no-plugins-text")
                 self.plugin_buttons_layout.insertWidget(
                      self.plugin_buttons_layout.count() - 1,
                      self.no_plugins_label
                  )
+                self._i18n_bindings["plugins.none_available"] = self.no_plugins_label
     
     def enable_plugin_button(self, plugin_name):
         """启用插件按钮"""
+        if self.plugin_button_states.get(plugin_name) is True:
+            return
         if plugin_name in self.plugin_buttons:
+            self.plugin_button_states[plugin_name] = True
             button = self.plugin_buttons[plugin_name]
             button.setEnabled(True)
-            button.setObjectName("plugin-button")
-            # 强制刷新样式
-            button.style().unpolish(button)
-            button.style().polish(button)
-            logger.debug(f"[PLUGIN] ✅ Plugin button enabled: {plugin_name}")
+            self._set_plugin_button_state(button, "normal")
+            logger.debug("[PLUGIN] ✅ Plugin button enabled: %s", plugin_name)
     
     def disable_plugin_button(self, plugin_name):
         """禁用插件按钮"""
+        if self.plugin_button_states.get(plugin_name) is False:
+            return
         if plugin_name in self.plugin_buttons:
+            self.plugin_button_states[plugin_name] = False
             button = self.plugin_buttons[plugin_name]
             button.setEnabled(True)  # 保持按钮可点击
-            button.setObjectName("plugin-button-disabled")
-            # 强制刷新样式
-            button.style().unpolish(button)
-            button.style().polish(button)
-            logger.debug(f"[PLUGIN] ❌ Plugin button disabled: {plugin_name}")
+            self._set_plugin_button_state(button, "disabled")
+            logger.debug("[PLUGIN] ❌ Plugin button disabled: %s", plugin_name)
+    
+    def _set_plugin_button_state(self, button, state):
+        """通过动态属性切换插件按钮样式状态"""
+        button.setProperty("state", state)
+        # 动态属性变化后需先unpolish再polish，样式表才会重新匹配
+        style = button.style()
+        style.unpolish(button)
+        style.polish(button)
     
-    def on_language_changed(self):
+    @Slot(str)
+    def on_language_changed(self, language_code=None):
         """语言变更时更新界面文本"""
-        # 更新欢迎区域文本
-        if hasattr(self, 'title_label') and self.title_label is not None:
-            self.title_label.setText(tr("app.title"))
-        if hasattr(self, 'subtitle_label') and self.subtitle_label is not None:
-            self.subtitle_label.setText(tr("app.subtitle"))
-        
-        # 更新插件列表标题
-        if hasattr(self, 'plugin_list_title') and self.plugin_list_title is not None:
-            self.plugin_list_title.setText(tr("plugins.available"))
-        
-        # 更新无插件提示
-        if hasattr(self, 'no_plugins_label') and self.no_plugins_label is not None:
-            self.no_plugins_label.setText(tr("plugins.none_available"))
-        
-        # 更新欢迎标签页
-        if hasattr(self, 'welcome_tab_index') and self.welcome_tab_index is not None:
-            self.tab_widget.setTabText(self.welcome_tab_index, tr("tab.welcome"))
-        
-        # 更新欢迎页面内容
-        if hasattr(self, 'welcome_title') and self.welcome_title is not None:
-            self.welcome_title.setText(tr("welcome.title"))
-        if hasattr(self, 'welcome_desc') and self.welcome_desc is not None:
-            self.welcome_desc.setText(tr("welcome.description"))
+        # 按新语言重新解析静态文本
+        self._t = self.i18n_manager.translate_batch(_STATIC_KEYS)
+        
+        # 更新已绑定翻译键的标签文本（文本未变化时跳过，避免重新布局）
+        for key, label in self._i18n_bindings.items():
+            text = self._t[key]
+            if label.text() != text:
+                label.setText(text)
+        
+        # 更新欢迎标签页（已关闭时重新显示时再设置标题）
+        index = self.tab_widget.indexOf(self._welcome_widget)
+        if index >= 0:
+            text = self._t["tab.welcome"]
+            if self.tab_widget.tabText(index) != text:
+                self.tab_widget.setTabText(index, text)
         
         logger.debug("[SETTINGS] 🌐 Main window text updated")
     
     def on_settings_changed(self):
         """设置变更时的处理"""
-        # 通知父窗口更新菜单栏
-        if self.parent():
-            parent = self.parent()
-            if hasattr(parent, '_create_menu_bar'):
-                parent.menuBar().clear()
-                parent._create_menu_bar()
+        # 通知父窗口原地更新菜单栏文本（无需清空重建菜单）
+        retranslate_menus = self._parent_callback('_retranslate_menus')
+        if retranslate_menus is not None:
+            retranslate_menus()
         logger.debug("[SETTINGS] ⚙️ Settings change handled")
     
+    def _parent_callback(self, name):
+        """获取父窗口的回调方法，首次解析后缓存，父窗口已销毁时返回None"""
+        method_ref = self._parent_callbacks.get(name)
+        if method_ref is None:
+            parent = self._parent_ref() if self._parent_ref is not None else None
+            method = getattr(parent, name, None)
+            if method is None:
+                return None
+            method_ref = self._parent_callbacks[name] = weakref.WeakMethod(method)
+        return method_ref()
+    
     def get_plugin_widget(self, plugin_name):
         """获取插件界面"""
         return self.plugin_widgets.get(plugin_name)
@@ -365,30 +428,30 @@ class MainWindow(QWidget):
     def show_plugin_manager(self):
         """显示插件管理器"""
         # 通过父窗口调用插件管理器
-        if self.parent() and hasattr(self.parent(), '_show_plugin_manager'):
-            self.parent()._show_plugin_manager()
+        show = self._parent_callback('_show_plugin_manager')
+        if show is not None:
+            show()
         logger.debug("[PLUGIN] 🔧 Show plugin manager")
     
     def show_settings(self):
         """显示设置对话框"""
         # 通过父窗口调用设置对话框
-        if self.parent() and hasattr(self.parent(), '_show_settings'):
-            self.parent()._show_settings()
+        show = self._parent_callback('_show_settings')
+        if show is not None:
+            show()
         logger.debug("[SETTINGS] ⚙️ Show settings dialog")
     
     def show_welcome_tab(self):
         """显示欢迎页标签"""
         # 检查欢迎页是否已经存在
-        if hasattr(self, 'welcome_tab_index') and self.welcome_tab_index is not None:
+        index = self.tab_widget.indexOf(self._welcome_widget)
+        if index >= 0:
             # 如果欢迎页还在，直接切换到它
-            for i in range(self.tab_widget.count()):
-                if i == self.welcome_tab_index:
-                    self.tab_widget.setCurrentIndex(i)
-                    logger.debug("[UI] 📋 Switched to existing welcome tab")
-                    return
-        
-        # 如果欢迎页不存在，重新创建
-        welcome_tab = self._create_welcome_tab()
-        self.welcome_tab_index = self.tab_widget.addTab(welcome_tab, tr("tab.welcome"))
-        self.tab_widget.setCurrentIndex(self.welcome_tab_index)
-        logger.debug("[UI] 📋 Created and showed new welcome tab")
\ No newline at end of file
+            self.tab_widget.setCurrentIndex(index)
+            logger.debug("[UI] 📋 Switched to existing welcome tab")
+            return
+        
+        # 如果欢迎页已关闭，重新添加之前的控件（removeTab不会销毁控件）
+        index = self.tab_widget.addTab(self._welcome_widget, self._t["tab.welcome"])
+        self.tab_widget.setCurrentIndex(index)
+        logger.debug("[UI] 📋 Re-added welcome tab")
\ No newline at end of file
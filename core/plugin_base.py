@@ -3,28 +3,53 @@
 HSBC Little Worker - 插件基类
 """
 
+import os
 import sys
 import json
-from abc import ABC, abstractmethod
+import weakref
+from abc import abstractmethod
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, ClassVar
 
 from PySide6.QtWidgets import QWidget
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QCoreApplication, QObject, Signal, QTimer
 
 from utils.logger import logger
 from utils.crypto import decrypt_password, is_password_field
+from utils.json_utils import json_loads, json_dumps
+from core.i18n import get_i18n_manager, intern_translations
 
 
-class PluginMeta(type(QObject), type(ABC)):
-    """解决QObject和ABC元类冲突的元类"""
-    pass
+# 插件日志方法预先绑定，log_*调用时省去logger属性查找
+_log_info = logger.info
+_log_warning = logger.warning
+_log_error = logger.error
+_log_debug = logger.debug
 
+# 区分"设置不存在"与"设置值为None"的哨兵
+_MISSING = object()
 
-class PluginBase(QObject, ABC, metaclass=PluginMeta):
+# 插件界面尚未创建的哨兵（create_widget()返回None表示插件没有界面）
+_UNSET = object()
+
+
+# 设置变更后延迟写入config.json的时间（毫秒），合并连续的多次写入
+_SAVE_DELAY_MS = 250
+
+# 插件始终支持的语言（没有对应翻译文件时回退到全局翻译）
+_DEFAULT_LANGUAGES = frozenset({"zh_CN", "en_US"})
+
+# 插件子类必须重写的类元信息（VERSION的默认值本身是合法版本号，不做检查）
+_REQUIRED_META_ATTRS = ('NAME', 'DISPLAY_NAME', 'DESCRIPTION', 'AUTHOR')
+
+# 插件子类必须实现的抽象方法
+_REQUIRED_METHODS = ("initialize", "create_widget")
+
+
+class PluginBase(QObject):
     """插件基类
     
-    所有插件都必须继承此类并实现抽象方法
+    所有插件都必须继承此类并实现initialize()和create_widget()
     """
     
     # 插件元信息（子类应该重写这些属性）
@@ -34,15 +59,57 @@ class PluginBase(QObject, ABC, metaclass=PluginMeta):
     VERSION = "1.0.0"
     AUTHOR = "Unknown Author"
     
+    # 全局国际化管理器（首次翻译时获取，所有插件共享）
+    _i18n_manager = None
+    
+    # 插件目录 -> {语言代码: 本地翻译}（同一插件的多个实例共享，按语言逐个加载）
+    _translation_cache: ClassVar[Dict[str, Dict[str, Optional[Dict[str, str]]]]] = {}
+    
+    # 插件类 -> 插件目录（每个插件类只解析一次，插件卸载重新导入后随旧类释放）
+    _plugin_dir_cache: ClassVar["weakref.WeakKeyDictionary[type, Optional[Path]]"] = weakref.WeakKeyDictionary()
+    
+    # 已确认实现全部抽象方法的插件类（每个插件类只检查一次）
+    _concrete_classes: ClassVar["weakref.WeakSet[type]"] = weakref.WeakSet()
+    
+    # 插件类 -> 合规性检查结果(is_available, error_info)，每个插件类只检查一次
+    _compliance_results: ClassVar["weakref.WeakKeyDictionary[type, tuple]"] = weakref.WeakKeyDictionary()
+    
     # 信号定义
     status_changed = Signal(str)  # 状态变化信号
     error_occurred = Signal(str)  # 错误发生信号
     
     def __init__(self, app=None):
+        # 与ABC一致，实例化时才拒绝未实现抽象方法的类，中间基类仍可正常定义
+        cls = self.__class__
+        if cls not in PluginBase._concrete_classes:
+            abstract_methods = [
+                name for name in _REQUIRED_METHODS
+                if getattr(getattr(cls, name), '__isabstractmethod__', False)
+            ]
+            if abstract_methods:
+                raise TypeError(
+                    f"Can't instantiate abstract class {cls.__name__} "
+                    f"with abstract methods {', '.join(abstract_methods)}"
+                )
+            PluginBase._concrete_classes.add(cls)
+        
         super().__init__()
         
+        # 插件名称及日志前缀只计算一次
+        module_name = self.__class__.__module__
+        self._name = sys.intern(module_name.rsplit('.', 1)[-1] if '.' in module_name else self.__class__.__name__)
+        self._log_prefix = f"[{self._name}] "
+        # __str__ 文本及 __repr__ 中不变部分，首次使用时生成
+        self._str_cache = None
+        self._repr_prefix = None
+        
         self.app = app  # 主应用程序引用
-        self._widget = None  # 插件界面组件
+        # 主应用程序提供的访问方法，只解析一次
+        self._get_plugin_manager_fn = getattr(app, 'get_plugin_manager', None) if app else None
+        self._status_bar_fn = getattr(app, 'statusBar', None) if app else None
+        self._plugin_manager = None  # 插件管理器引用（首次获取后缓存）
+        self._widget = _UNSET  # 插件界面组件（首次获取时创建）
+        self._creating_widget = False  # 是否正在执行create_widget()
         self._initialized = False  # 初始化状态
         self._enabled = True  # 启用状态
         self.is_available = True  # 插件可用状态
@@ -51,16 +118,26 @@ class PluginBase(QObject, ABC, metaclass=PluginMeta):
         # 插件本地化支持
         self._plugin_dir = None
         self._config = {}
-        self._translations = {}
+        self._config_loaded = False  # config.json在首次使用时加载
+        self._config_mtime = None  # 已加载config.json的修改时间
+        self._save_pending = False  # 是否有尚未写入文件的设置变更
+        self._settings_cache: Dict[str, Any] = {}  # 设置值缓存，配置文件变化时清空
+        self._translations = {}  # 语言代码 -> 本地翻译（无翻译文件时为None）
         self._current_language = "zh_CN"
         
-        # 插件合规性检查
-        self._check_plugin_compliance()
-    
-        # 初始化插件目录和配置
+        # 初始化插件目录（合规性检查复用同一结果，配置和翻译文件延迟到首次使用时加载）
         self._init_plugin_paths()
-        self._load_plugin_config()
-        self._load_plugin_translations()
+        
+        # 插件合规性检查（结果只取决于插件类，同一类的后续实例直接复用）
+        compliance = PluginBase._compliance_results.get(cls)
+        if compliance is None:
+            self._check_plugin_compliance()
+            PluginBase._compliance_results[cls] = (self.is_available, self.error_info)
+        else:
+            self.is_available, self.error_info = compliance
+        
+        if self._plugin_dir:
+            self._translations = PluginBase._translation_cache.setdefault(str(self._plugin_dir), {})
     
     @abstractmethod
     def initialize(self) -> bool:
@@ -86,14 +163,17 @@ class PluginBase(QObject, ABC, metaclass=PluginMeta):
         插件卸载时调用，用于清理资源、保存状态等
         """
         try:
-            if self._widget:
-                self._widget.close()
-                self._widget = None
+            self.flush_settings()
+            
+            widget = self._widget
+            self._widget = _UNSET
+            if widget is not _UNSET and widget is not None:
+                widget.close()
             
             self._initialized = False
             
         except Exception as e:
-            logger.error(f"❌ Plugin {self.get_name()} cleanup error: {e}")
+            logger.error("❌ Plugin %s cleanup error: %s", self.get_name(), e)
     
     def get_widget(self) -> Optional[QWidget]:
         """获取插件界面组件
@@ -101,14 +181,21 @@ class PluginBase(QObject, ABC, metaclass=PluginMeta):
         Returns:
             QWidget: 插件的界面组件
         """
-        if self._widget is None:
+        if self._widget is _UNSET:
+            if self._creating_widget:
+                # create_widget()执行期间的重入调用（如处理事件时触发的槽函数），不重复创建
+                return None
+            # 只创建一次，即使插件没有界面（返回None）也不再重复调用create_widget()
+            self._creating_widget = True
             try:
                 self._widget = self.create_widget()
-                if self._widget:
-                    pass
             except Exception as e:
-                logger.error(f"❌ Plugin {self.get_name()} widget creation error: {e}")
+                # 创建失败时保持未创建状态，下次获取时重试
+                logger.error("❌ Plugin %s widget creation error: %s", self.get_name(), e)
                 self.error_occurred.emit(str(e))
+                return None
+            finally:
+                self._creating_widget = False
         
         return self._widget
     
@@ -118,7 +205,7 @@ class PluginBase(QObject, ABC, metaclass=PluginMeta):
         Returns:
             str: 插件名称（通常是类名或模块名）
         """
-        return self.__class__.__module__.split('.')[-1] if '.' in self.__class__.__module__ else self.__class__.__name__
+        return self._name
     
     def get_display_name(self) -> str:
         """获取插件显示名称
@@ -166,6 +253,7 @@ class PluginBase(QObject, ABC, metaclass=PluginMeta):
         Returns:
             bool: 是否启用
         """
+        self._ensure_plugin_config()
         return self._enabled
     
     def set_enabled(self, enabled: bool):
@@ -174,10 +262,11 @@ class PluginBase(QObject, ABC, metaclass=PluginMeta):
         Args:
             enabled: 是否启用
         """
+        self._ensure_plugin_config()
         if self._enabled != enabled:
             self._enabled = enabled
             status = "enabled" if enabled else "disabled"
-            logger.info(f"🔄 Plugin {self.get_name()} {status}")
+            logger.info("🔄 Plugin %s %s", self._name, status)
             self.status_changed.emit(status)
     
     def get_app(self):
@@ -194,9 +283,9 @@ class PluginBase(QObject, ABC, metaclass=PluginMeta):
         Returns:
             插件管理器实例
         """
-        if self.app and hasattr(self.app, 'get_plugin_manager'):
-            return self.app.get_plugin_manager()
-        return None
+        if self._plugin_manager is None and self._get_plugin_manager_fn is not None:
+            self._plugin_manager = self._get_plugin_manager_fn()
+        return self._plugin_manager
     
     def get_setting(self, key: str, default=None):
         """获取插件设置
@@ -208,22 +297,43 @@ class PluginBase(QObject, ABC, metaclass=PluginMeta):
         Returns:
             设置值
         """
-        # 首先尝试从available_config中获取（实时读取）
-        if self._config and 'available_config' in self._config:
-            # 重新加载配置以获取最新值
-            self._load_plugin_config()
-            if key in self._config.get('available_config', {}):
-                return self._config['available_config'][key]
+        # 配置文件被外部修改时重新加载（同时清空设置缓存）
+        self._refresh_plugin_config()
         
-        # 优先使用本地配置
-        if self._config and 'settings' in self._config:
-            return self._config['settings'].get(key, default)
+        settings_cache = self._settings_cache
+        value = settings_cache.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        
+        config = self._config
+        
+        # 首先尝试从available_config中获取
+        available_config = config.get('available_config')
+        if available_config is not None:
+            value = available_config.get(key, _MISSING)
+            if value is not _MISSING:
+                settings_cache[key] = value
+                return value
         
-        # 回退到全局配置
-        plugin_manager = self.get_plugin_manager()
+        # 优先使用本地配置
+        settings = config.get('settings')
+        if settings is not None:
+            value = settings.get(key, _MISSING)
+            if value is _MISSING:
+                return default
+            settings_cache[key] = value
+            return value
+        
+        # 回退到全局配置（由插件管理器维护，不写入本地缓存）
+        plugin_manager = self._plugin_manager or self.get_plugin_manager()
         if plugin_manager:
-            return plugin_manager.get_plugin_setting(self.get_name(), key, default)
+            return plugin_manager.get_plugin_setting(self._name, key, default)
         return default
+    
+    def invalidate_settings_cache(self):
+        """清空设置缓存，下次读取设置时重新加载配置文件"""
+        self._settings_cache.clear()
+        self._config_mtime = None
 
     def get_available_config(self) -> dict:
         """获取插件配置
@@ -231,6 +341,7 @@ class PluginBase(QObject, ABC, metaclass=PluginMeta):
         Returns:
             dict: 插件配置字典
         """
+        self._ensure_plugin_config()
         return self._config.get('available_config', {})
     
     def get_decrypted_setting(self, key: str, default=None):
@@ -269,16 +380,25 @@ class PluginBase(QObject, ABC, metaclass=PluginMeta):
             value: 设置值
         """
         # 优先使用本地配置
+        self._ensure_plugin_config()
         if self._config:
             if 'settings' not in self._config:
                 self._config['settings'] = {}
             self._config['settings'][key] = value
-            self._save_plugin_config()
+            self._settings_cache[key] = value
+            # 延迟写入，短时间内的多次设置变更只写一次文件
+            if QCoreApplication.instance() is None:
+                # 没有事件循环时定时器不会触发，直接写入
+                self._save_pending = True
+                self.flush_settings()
+            elif not self._save_pending:
+                self._save_pending = True
+                QTimer.singleShot(_SAVE_DELAY_MS, self.flush_settings)
         else:
             # 回退到全局配置
-            plugin_manager = self.get_plugin_manager()
+            plugin_manager = self._plugin_manager or self.get_plugin_manager()
             if plugin_manager:
-                plugin_manager.set_plugin_setting(self.get_name(), key, value)
+                plugin_manager.set_plugin_setting(self._name, key, value)
     
     def _init_plugin_paths(self):
         """初始化插件路径"""
@@ -286,33 +406,67 @@ class PluginBase(QObject, ABC, metaclass=PluginMeta):
             # 使用统一的方法获取插件目录
             self._plugin_dir = self._get_plugin_directory()
             if self._plugin_dir:
-                logger.debug(f"[PLUGIN] 🔍 Plugin paths initialized: {self._plugin_dir}")
+                logger.debug("[PLUGIN] 🔍 Plugin paths initialized: %s", self._plugin_dir)
             else:
-                logger.warning(f"[PLUGIN] ⚠️ Could not determine plugin directory for {self.get_name()}")
+                logger.warning("[PLUGIN] ⚠️ Could not determine plugin directory for %s", self.get_name())
         except Exception as e:
-            import traceback
-            logger.error(f"[PLUGIN] ❌ Failed to init plugin paths: {e} - {traceback.format_exc()}")
+            logger.error("[PLUGIN] ❌ Failed to init plugin paths: %s", e, exc_info=True)
+    
+    def _ensure_plugin_config(self):
+        """确保插件本地配置已加载"""
+        if not self._config_loaded:
+            self._load_plugin_config()
     
     def _load_plugin_config(self):
         """加载插件本地配置"""
+        self._config_loaded = True
         if not self._plugin_dir:
             return
         
         config_file = self._plugin_dir / "config.json"
         if config_file.exists():
             try:
-                with open(config_file, 'r', encoding='utf-8') as f:
-                    self._config = json.load(f)
-                
-                # 从配置文件中读取enabled状态
-                available_config = self._config.get('available_config', {})
-                self._enabled = available_config.get('enabled', True)
-                
-                logger.debug(f"📋 [Plugin] Config loaded for {self.get_name()}, enabled: {self._enabled}")
+                mtime = config_file.stat().st_mtime_ns
+                self._apply_plugin_config(json_loads(config_file.read_bytes()), mtime)
+                logger.debug("📋 [Plugin] Config loaded for %s, enabled: %s", self._name, self._enabled)
             except Exception as e:
-                logger.error(f"❌ [Plugin] Failed to load config for {self.get_name()}: {e}")
+                logger.error("❌ [Plugin] Failed to load config for %s: %s", self.get_name(), e)
                 self._config = {}
     
+    def _apply_plugin_config(self, config: dict, mtime: int):
+        """使用已解析的config.json内容作为插件当前配置
+        
+        Args:
+            config: 解析后的配置字典
+            mtime: 读取时配置文件的修改时间
+        """
+        self._config = config
+        self._config_mtime = mtime
+        self._config_loaded = True
+        self._settings_cache.clear()
+        
+        # 从配置文件中读取enabled状态
+        available_config = config.get('available_config', {})
+        self._enabled = available_config.get('enabled', True)
+    
+    def _refresh_plugin_config(self):
+        """config.json的修改时间变化时重新加载配置"""
+        if not self._plugin_dir or self._save_pending:
+            # 有未写入的设置变更时以内存中的配置为准
+            return
+        try:
+            mtime = (self._plugin_dir / "config.json").stat().st_mtime_ns
+        except OSError:
+            return
+        if mtime != self._config_mtime:
+            self._load_plugin_config()
+    
+    def flush_settings(self):
+        """立即写入尚未保存的设置变更"""
+        if self._save_pending:
+            self._save_pending = False
+            self._save_plugin_config()
+    
     def _save_plugin_config(self):
         """保存插件本地配置"""
         if not self._plugin_dir or not self._config:
@@ -320,30 +474,44 @@ class PluginBase(QObject, ABC, metaclass=PluginMeta):
         
         config_file = self._plugin_dir / "config.json"
         try:
-            with open(config_file, 'w', encoding='utf-8') as f:
-                json.dump(self._config, f, indent=2, ensure_ascii=False)
-            logger.debug(f"💾 [Plugin] Config saved for {self.get_name()}")
+            # 先写临时文件再原子替换，避免写入中断导致配置损坏
+            tmp_file = config_file.with_name("config.json.tmp")
+            tmp_file.write_bytes(json_dumps(self._config))
+            os.replace(tmp_file, config_file)
+            # 内存中的配置即为最新，无需因本次写入重新加载
+            self._config_mtime = config_file.stat().st_mtime_ns
+            logger.debug("💾 [Plugin] Config saved for %s", self._name)
         except Exception as e:
-            logger.error(f"❌ [Plugin] Failed to save config for {self.get_name()}: {e}")
+            logger.error("❌ [Plugin] Failed to save config for %s: %s", self.get_name(), e)
     
-    def _load_plugin_translations(self):
-        """加载插件翻译文件"""
-        if not self._plugin_dir:
-            return
+    def _get_local_translations(self, lang_code: str) -> Optional[Dict[str, str]]:
+        """获取指定语言的本地翻译，每种语言的翻译文件在首次使用时加载
         
-        translations_dir = self._plugin_dir / "translations"
-        if not translations_dir.exists():
-            return
+        Args:
+            lang_code: 语言代码
+            
+        Returns:
+            Optional[Dict[str, str]]: 翻译字典，没有该语言的翻译文件时返回None
+        """
+        try:
+            return self._translations[lang_code]
+        except KeyError:
+            pass
         
-        # 加载所有语言的翻译文件
-        for lang_file in translations_dir.glob("*.json"):
-            lang_code = lang_file.stem
+        translations = None
+        if self._plugin_dir:
+            lang_file = self._plugin_dir / "translations" / f"{lang_code}.json"
             try:
-                with open(lang_file, 'r', encoding='utf-8') as f:
-                    self._translations[lang_code] = json.load(f)
-                logger.debug(f"🌍 [Plugin] Translation loaded for {self.get_name()}: {lang_code}")
+                translations = intern_translations(json_loads(lang_file.read_bytes()))
+                logger.debug("🌍 [Plugin] Translation loaded for %s: %s", self._name, lang_code)
+            except FileNotFoundError:
+                pass
             except Exception as e:
-                logger.error(f"❌ [Plugin] Failed to load translation {lang_file}: {e}")
+                logger.error("❌ [Plugin] Failed to load translation %s: %s", lang_file, e)
+        
+        # 缺失的语言同样记录，避免重复查找文件
+        self._translations[lang_code] = translations
+        return translations
     
     def tr(self, key: str, **kwargs) -> str:
         """
@@ -357,28 +525,23 @@ class PluginBase(QObject, ABC, metaclass=PluginMeta):
             str: 翻译后的文本
         """
         # 首先尝试从全局国际化管理器获取插件翻译
-        from core.i18n import i18n_manager
-        plugin_name = self.__class__.__module__.split('.')[-1]  # 获取插件名称
-        text = i18n_manager.get_plugin_translation(plugin_name, key)
-        
-        if text != key:  # 如果找到了翻译
-            if kwargs:
-                try:
-                    return text.format(**kwargs)
-                except (KeyError, ValueError):
-                    return text
-            return text
-        
-        # 回退到本地翻译
-        if self._translations and self._current_language in self._translations:
-            text = self._translations[self._current_language].get(key, key)
-            if kwargs:
-                try:
-                    return text.format(**kwargs)
-                except (KeyError, ValueError):
-                    return text
-            return text
-        return key
+        i18n_manager = PluginBase._i18n_manager
+        if i18n_manager is None:
+            i18n_manager = PluginBase._i18n_manager = get_i18n_manager()
+        text = i18n_manager.get_plugin_translation(self._name, key)
+        
+        # 未找到时回退到本地翻译
+        if text == key:
+            local = self._get_local_translations(self._current_language)
+            text = local.get(key, key) if local else key
+        
+        # 传入格式化参数时统一格式化
+        if kwargs:
+            try:
+                return text.format(**kwargs)
+            except (KeyError, ValueError):
+                pass
+        return text
     
     def set_language(self, language_code: str):
         """设置插件语言
@@ -386,9 +549,12 @@ class PluginBase(QObject, ABC, metaclass=PluginMeta):
         Args:
             language_code: 语言代码
         """
-        if language_code in self._translations or language_code in ["zh_CN", "en_US"]:
-            self._current_language = language_code
-            logger.debug(f"🌍 [Plugin] Language set to {language_code} for {self.get_name()}")
+        # 内置语言无需读取翻译文件即可判断
+        if language_code not in _DEFAULT_LANGUAGES:
+            if self._get_local_translations(language_code) is None:
+                return
+        self._current_language = language_code
+        logger.debug("🌍 [Plugin] Language set to %s for %s", language_code, self._name)
     
     def show_status_message(self, message: str, timeout: int = 3000):
         """在状态栏显示消息
@@ -397,10 +563,11 @@ class PluginBase(QObject, ABC, metaclass=PluginMeta):
             message: 要显示的消息
             timeout: 显示时间（毫秒）
         """
-        if self.app and hasattr(self.app, 'statusBar'):
-            status_bar = self.app.statusBar()
-            if status_bar:
-                status_bar.showMessage(f"[{self.get_display_name()}] {message}", timeout)
+        if self._status_bar_fn is None:
+            return
+        status_bar = self._status_bar_fn()
+        if status_bar:
+            status_bar.showMessage(f"[{self.get_display_name()}] {message}", timeout)
     
     def log_info(self, message: str):
         """记录信息日志
@@ -408,7 +575,7 @@ class PluginBase(QObject, ABC, metaclass=PluginMeta):
         Args:
             message: 日志消息
         """
-        logger.info(f"[{self.get_name()}] {message}")
+        _log_info("%s%s", self._log_prefix, message)
     
     def log_warning(self, message: str):
         """记录警告日志
@@ -416,7 +583,7 @@ class PluginBase(QObject, ABC, metaclass=PluginMeta):
         Args:
             message: 日志消息
         """
-        logger.warning(f"[{self.get_name()}] {message}")
+        _log_warning("%s%s", self._log_prefix, message)
     
     def log_error(self, message: str):
         """记录错误日志
@@ -424,7 +591,7 @@ class PluginBase(QObject, ABC, metaclass=PluginMeta):
         Args:
             message: 日志消息
         """
-        logger.error(f"[{self.get_name()}] {message}")
+        _log_error("%s%s", self._log_prefix, message)
     
     def log_debug(self, message: str):
         """记录调试日志
@@ -432,23 +599,25 @@ class PluginBase(QObject, ABC, metaclass=PluginMeta):
         Args:
             message: 日志消息
         """
-        logger.debug(f"[{self.get_name()}] {message}")
+        _log_debug("%s%s", self._log_prefix, message)
     
     def __str__(self) -> str:
         """字符串表示"""
-        return f"{self.get_display_name()} v{self.get_version()}"
+        if self._str_cache is None:
+            self._str_cache = f"{self.get_display_name()} v{self.get_version()}"
+        return self._str_cache
     
     def __repr__(self) -> str:
         """详细字符串表示"""
-        return (
-            f"<{self.__class__.__name__}("
-            f"name='{self.get_name()}', "
-            f"display_name='{self.get_display_name()}', "
-            f"version='{self.get_version()}', "
-            f"initialized={self._initialized}, "
-            f"enabled={self._enabled}"
-            f")>"
-        )
+        # 名称、显示名称和版本不会变化，只需拼接一次；初始化和启用状态每次读取
+        if self._repr_prefix is None:
+            self._repr_prefix = (
+                f"<{self.__class__.__name__}("
+                f"name='{self.get_name()}', "
+                f"display_name='{self.get_display_name()}', "
+                f"version='{self.get_version()}', "
+            )
+        return "%sinitialized=%s, enabled=%s)>" % (self._repr_prefix, self._initialized, self._enabled)
     
     def _check_plugin_compliance(self):
         """检查插件合规性
@@ -459,26 +628,25 @@ class PluginBase(QObject, ABC, metaclass=PluginMeta):
         3. 验证config.json格式
         """
         try:
-            # 检查必需的类元信息
-            required_attrs = ['NAME', 'DISPLAY_NAME', 'DESCRIPTION', 'VERSION', 'AUTHOR']
-            missing_attrs = []
-            
-            for attr in required_attrs:
-                if not hasattr(self.__class__, attr) or getattr(self.__class__, attr) == f"Unknown {attr.replace('_', ' ').title()}":
-                    missing_attrs.append(attr)
+            # 检查必需的类元信息（仍为基类默认值即视为未设置）
+            cls = self.__class__
+            missing_attrs = [
+                attr for attr in _REQUIRED_META_ATTRS
+                if getattr(cls, attr) == getattr(PluginBase, attr)
+            ]
             
             if missing_attrs:
                 error_msg = f"Missing required attributes: {', '.join(missing_attrs)}"
-                logger.warning(f"⚠️ [Plugin Compliance] {self.get_name()} {error_msg}")
+                logger.warning("⚠️ [Plugin Compliance] %s %s", self.get_name(), error_msg)
                 self.is_available = False
                 self.error_info = error_msg
                 return
             
-            # 获取插件目录
-            plugin_dir = self._get_plugin_directory()
+            # 插件目录已在_init_plugin_paths()中解析
+            plugin_dir = self._plugin_dir
             if not plugin_dir:
                 error_msg = "Cannot determine plugin directory"
-                logger.error(f"❌ [Plugin Compliance] {error_msg} for {self.get_name()}")
+                logger.error("❌ [Plugin Compliance] %s for %s", error_msg, self.get_name())
                 self.is_available = False
                 self.error_info = error_msg
                 return
@@ -495,14 +663,22 @@ class PluginBase(QObject, ABC, metaclass=PluginMeta):
                     return  # 验证失败，错误信息已设置
                 
         except Exception as e:
-            import traceback
             error_msg = f"Error checking compliance: {e}"
-            logger.error(f"❌ [Plugin Compliance] {error_msg} for {self.get_name()} - {traceback.format_exc()}")
+            logger.error("❌ [Plugin Compliance] %s for %s", error_msg, self.get_name(), exc_info=True)
             self.is_available = False
             self.error_info = error_msg
     
     def _get_plugin_directory(self) -> Optional[Path]:
-        """获取插件目录路径"""
+        """获取插件目录路径（按插件类缓存）"""
+        cls = self.__class__
+        try:
+            return PluginBase._plugin_dir_cache[cls]
+        except KeyError:
+            plugin_dir = PluginBase._plugin_dir_cache[cls] = self._find_plugin_directory()
+            return plugin_dir
+    
+    def _find_plugin_directory(self) -> Optional[Path]:
+        """解析插件目录路径"""
         try:
             # 尝试从模块文件路径获取
             module_name = self.__class__.__module__
@@ -510,7 +686,7 @@ class PluginBase(QObject, ABC, metaclass=PluginMeta):
                 module_file = sys.modules[module_name].__file__
                 if module_file:
                     plugin_dir = Path(module_file).parent
-                    logger.debug(f"[PLUGIN] 🔍 Found plugin directory: {plugin_dir}")
+                    logger.debug("[PLUGIN] 🔍 Found plugin directory: %s", plugin_dir)
                     return plugin_dir
             
             # 如果上述方法失败，尝试通过插件名称构建路径
@@ -527,11 +703,11 @@ class PluginBase(QObject, ABC, metaclass=PluginMeta):
                 
                 plugin_dir = project_root / "plugins" / plugin_name
                 if plugin_dir.exists():
-                    logger.debug(f"[PLUGIN] 🔍 Found plugin directory via name: {plugin_dir}")
+                    logger.debug("[PLUGIN] 🔍 Found plugin directory via name: %s", plugin_dir)
                     return plugin_dir
                     
         except Exception as e:
-            logger.error(f"[PLUGIN] ❌ Failed to get plugin directory: {e} - {traceback.format_exc()}")
+            logger.error("[PLUGIN] ❌ Failed to get plugin directory: %s", e, exc_info=True)
         return None
     
     def _generate_config_file(self, config_file: Path) -> bool:
@@ -557,83 +733,94 @@ class PluginBase(QObject, ABC, metaclass=PluginMeta):
             config_file.parent.mkdir(parents=True, exist_ok=True)
             
             # 写入配置文件
-            with open(config_file, 'w', encoding='utf-8') as f:
-                json.dump(config_data, f, indent=2, ensure_ascii=False)
+            config_file.write_bytes(json_dumps(config_data))
+            self._apply_plugin_config(config_data, config_file.stat().st_mtime_ns)
             
-            logger.info(f"📋 [Plugin Compliance] Auto-generated config.json for {plugin_name}")
+            logger.info("📋 [Plugin Compliance] Auto-generated config.json for %s", plugin_name)
             return True
             
         except Exception as e:
-            import traceback
             error_msg = f"Failed to generate config.json: {e}"
-            logger.error(f"❌ [Plugin Compliance] {error_msg} for {self.get_name()} - {traceback.format_exc()}")
+            logger.error("❌ [Plugin Compliance] %s for %s", error_msg, self.get_name(), exc_info=True)
             self.is_available = False
             self.error_info = error_msg
             return False
     
     def _validate_config_file(self, config_file: Path) -> bool:
-        """验证config.json文件格式"""
+        """验证config.json文件格式，验证通过的内容直接作为插件配置"""
         try:
-            with open(config_file, 'r', encoding='utf-8') as f:
-                config_data = json.load(f)
-            
-            # 检查必需的字段
-            if 'plugin_info' not in config_data:
-                error_msg = "config.json missing 'plugin_info' field"
-                logger.error(f"❌ [Plugin Compliance] {self.get_name()} {error_msg}")
-                self.is_available = False
-                self.error_info = error_msg
+            mtime = config_file.stat().st_mtime_ns
+            config_data = json_loads(config_file.read_bytes())
+            if not self._validate_config_dict(config_data):
                 return False
             
-            if 'available_config' not in config_data:
-                error_msg = "config.json missing 'available_config' field"
-                logger.error(f"❌ [Plugin Compliance] {self.get_name()} {error_msg}")
-                self.is_available = False
-                self.error_info = error_msg
-                return False
-            
-            plugin_info = config_data['plugin_info']
-            required_info_fields = ['name', 'display_name', 'description', 'version', 'author']
-            
-            for field in required_info_fields:
-                if field not in plugin_info:
-                    error_msg = f"config.json missing required field: plugin_info.{field}"
-                    logger.error(f"❌ [Plugin Compliance] {self.get_name()} {error_msg}")
-                    self.is_available = False
-                    self.error_info = error_msg
-                    return False
-            
-            available_config = config_data['available_config']
-            if 'enabled' not in available_config:
-                error_msg = "config.json missing required field: available_config.enabled"
-                logger.error(f"❌ [Plugin Compliance] {self.get_name()} {error_msg}")
-                self.is_available = False
-                self.error_info = error_msg
-                return False
-            
-            if not isinstance(available_config['enabled'], bool):
-                error_msg = "config.json 'enabled' field must be boolean"
-                logger.error(f"❌ [Plugin Compliance] {self.get_name()} {error_msg}")
-                self.is_available = False
-                self.error_info = error_msg
-                return False
-            
-            logger.debug(f"✅ [Plugin Compliance] {self.get_name()} config.json validation passed")
+            # 已解析的配置直接使用，首次读取设置时无需再次解析文件
+            self._apply_plugin_config(config_data, mtime)
+            logger.debug("✅ [Plugin Compliance] %s config.json validation passed", self._name)
             return True
             
         except json.JSONDecodeError as e:
             error_msg = f"config.json is not valid JSON: {e}"
-            logger.error(f"❌ [Plugin Compliance] {self.get_name()} {error_msg}")
+            logger.error("❌ [Plugin Compliance] %s %s", self.get_name(), error_msg)
             self.is_available = False
             self.error_info = error_msg
             return False
         except Exception as e:
-            import traceback
             error_msg = f"Failed to validate config.json: {e}"
-            logger.error(f"❌ [Plugin Compliance] {error_msg} for {self.get_name()} - {traceback.format_exc()}")
+            logger.error("❌ [Plugin Compliance] %s for %s", error_msg, self.get_name(), exc_info=True)
+            self.is_available = False
+            self.error_info = error_msg
+            return False
+    
+    def _validate_config_dict(self, config_data: dict) -> bool:
+        """检查config.json内容是否包含必需的字段
+        
+        Args:
+            config_data: 解析后的配置字典
+            
+        Returns:
+            bool: 是否通过检查（未通过时设置错误信息）
+        """
+        error_msg = PluginBase.get_config_error(config_data)
+        if error_msg:
+            logger.error("❌ [Plugin Compliance] %s %s", self.get_name(), error_msg)
             self.is_available = False
             self.error_info = error_msg
             return False
+        return True
+    
+    @staticmethod
+    def get_config_error(config_data: dict) -> Optional[str]:
+        """返回config.json内容的格式错误，格式正确时返回None
+        
+        Args:
+            config_data: 解析后的配置字典
+        """
+        if not isinstance(config_data, dict):
+            return "config.json root must be an object"
+        
+        # 检查必需的字段
+        if 'plugin_info' not in config_data:
+            return "config.json missing 'plugin_info' field"
+        
+        if 'available_config' not in config_data:
+            return "config.json missing 'available_config' field"
+        
+        plugin_info = config_data['plugin_info']
+        required_info_fields = ['name', 'display_name', 'description', 'version', 'author']
+        
+        for field in required_info_fields:
+            if field not in plugin_info:
+                return f"config.json missing required field: plugin_info.{field}"
+        
+        available_config = config_data['available_config']
+        if 'enabled' not in available_config:
+            return "config.json missing required field: available_config.enabled"
+        
+        if not isinstance(available_config['enabled'], bool):
+            return "config.json 'enabled' field must be boolean"
+        
+        return None
     
     def get_plugin_info(self) -> dict:
         """获取插件信息字典"""
@@ -5,18 +5,44 @@ HSBC Little Worker - 插件管理器
 
 import os
 import sys
-import json
+import hashlib
 import importlib.util
 import traceback
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Set
 
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QCoreApplication, QObject, QRunnable, QThreadPool, Signal
 
 from .plugin_base import PluginBase
 from utils.logger import logger
 from utils.crypto import decrypt_password, is_password_field
 from core.i18n import tr, i18n_manager
+from utils.json_utils import json_loads, json_dumps
+
+# 插件发现元数据的磁盘缓存，设置该环境变量可强制重新扫描
+_DISCOVERY_CACHE_FILE = Path.home() / '.cache' / 'littleworker' / 'plugins.json'
+_FORCE_REFRESH_ENV = 'LITTLEWORKER_FORCE_REFRESH'
+
+
+class _PluginImportTask(QRunnable):
+    """在线程池中导入插件模块的任务（只执行模块代码，不创建任何QObject）"""
+    
+    def __init__(self, manager: 'PluginManager', plugin_name: str):
+        super().__init__()
+        self.manager = manager
+        self.plugin_name = plugin_name
+    
+    def run(self):
+        module = None
+        try:
+            module = self.manager._import_plugin_module(self.plugin_name)
+        except BaseException as e:
+            # 插件代码可能抛出SystemExit等非Exception异常，同样交由主线程中的load_plugin重新导入并记录完整错误
+            logger.warning(f"[PLUGIN] ⚠️ Background import failed for {self.plugin_name}: {e!r}")
+        finally:
+            # 无论导入结果如何都必须通知主线程，否则等待计数永远无法归零
+            # 跨线程信号以队列方式投递到主线程
+            self.manager._plugin_module_imported.emit(self.plugin_name, module)
 
 
 class PluginManager(QObject):
@@ -29,12 +55,23 @@ class PluginManager(QObject):
     plugin_enabled = Signal(str)  # 插件启用信号
     plugin_disabled = Signal(str)  # 插件禁用信号
     plugin_config_changed = Signal(str, dict)  # 插件配置变更信号 (plugin_name, new_config)
+    plugins_loaded = Signal()  # 启动时所有启用插件加载完成信号
+    _plugin_module_imported = Signal(str, object)  # 后台导入完成信号 (plugin_name, module)
     
     def __init__(self, app):
         super().__init__()
         
         self.app = app
         self.plugins: Dict[str, PluginBase] = {}  # 已加载的插件实例
+        self._discovered_modules: Dict[str, Any] = {}  # 发现阶段已执行的插件模块，加载时复用
+        self._collect_discovered_modules = False  # 仅在启动加载期间保留发现阶段的模块
+        self._pending_plugins: List[str] = []  # 等待后台导入完成后按顺序加载的插件
+        self._pending_imports = 0
+        self._plugin_module_imported.connect(self._on_plugin_module_imported)
+        # 退出前写入插件尚未保存的设置，避免延迟写入的变更丢失
+        qt_app = QCoreApplication.instance()
+        if qt_app is not None:
+            qt_app.aboutToQuit.connect(self.flush_all_settings)
         # 插件目录路径
         self.plugins_dir = self._get_plugins_dir()
         
@@ -67,8 +104,101 @@ class PluginManager(QObject):
         
         return plugins_path
 
-    def discover_plugins(self) -> List[Dict[str, Any]]:
-        """发现可用插件"""
+    def _discovery_cache_key(self) -> str:
+        """根据Python环境、当前语言和插件目录的修改时间计算发现缓存的键"""
+        stamps = [sys.version, os.pathsep.join(sys.path), i18n_manager.get_current_language()]
+        stamps.append(str(os.stat(self.plugins_dir).st_mtime_ns))
+        with os.scandir(self.plugins_dir) as plugin_entries:
+            for plugin_entry in sorted(plugin_entries, key=lambda entry: entry.name):
+                if not plugin_entry.is_dir() or plugin_entry.name.startswith('_'):
+                    continue
+                # 只有插件模块（__init__.py等.py文件）变化才使缓存失效，
+                # config.json中的启用状态等在读取缓存时单独刷新
+                with os.scandir(plugin_entry.path) as file_entries:
+                    for file_entry in sorted(file_entries, key=lambda entry: entry.name):
+                        if file_entry.name.endswith('.py'):
+                            stamps.append(f"{plugin_entry.name}/{file_entry.name}:{file_entry.stat().st_mtime_ns}")
+        return hashlib.sha1('\n'.join(stamps).encode('utf-8')).hexdigest()
+    
+    def _load_discovery_cache(self, key: str) -> Optional[List[Dict[str, Any]]]:
+        """读取插件发现缓存，键不匹配或读取失败时返回None"""
+        if os.environ.get(_FORCE_REFRESH_ENV):
+            logger.info(f"[PLUGIN] 🔄 {_FORCE_REFRESH_ENV} set, ignoring discovery cache")
+            return None
+        try:
+            cache_data = json_loads(_DISCOVERY_CACHE_FILE.read_bytes())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"[PLUGIN] ⚠️ Failed to read discovery cache: {e}")
+            return None
+        if cache_data.get('key') != key:
+            return None
+        cached_plugins = cache_data.get('plugins')
+        if cached_plugins is None or not self._refresh_cached_plugin_configs(cached_plugins):
+            return None
+        return cached_plugins
+    
+    def _refresh_cached_plugin_configs(self, cached_plugins: List[Dict[str, Any]]) -> bool:
+        """用各插件当前的config.json刷新缓存条目中来自配置的字段
+        
+        Returns:
+            bool: 所有配置均可读且格式正确时返回True；否则缓存作废，
+                  由完整扫描重新进行合规性检查（包括生成缺失的config.json）
+        """
+        for plugin_info in cached_plugins:
+            if not plugin_info.get('is_available', True) or 'path' not in plugin_info:
+                continue
+            config_file = Path(plugin_info['path']) / "config.json"
+            try:
+                config_data = json_loads(config_file.read_bytes())
+            except FileNotFoundError:
+                return False
+            except Exception as e:
+                logger.warning(f"[PLUGIN] ⚠️ Failed to read config for {plugin_info.get('name')}: {e}")
+                return False
+            error_msg = PluginBase.get_config_error(config_data)
+            if error_msg:
+                logger.warning(f"[PLUGIN] ⚠️ Invalid config for {plugin_info.get('name')}: {error_msg}")
+                return False
+            available_config = config_data['available_config']
+            plugin_info['has_local_config'] = True
+            plugin_info['available_config'] = available_config
+            plugin_info['enabled'] = available_config['enabled']
+        return True
+    
+    def _save_discovery_cache(self, key: str, available_plugins: List[Dict[str, Any]]):
+        """写入插件发现缓存（插件类对象不可序列化，不写入缓存）"""
+        plugins = [
+            {k: v for k, v in plugin_info.items() if k != 'class'}
+            for plugin_info in available_plugins
+        ]
+        try:
+            _DISCOVERY_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = _DISCOVERY_CACHE_FILE.with_suffix('.tmp')
+            tmp_path.write_bytes(json_dumps({'key': key, 'plugins': plugins}))
+            os.replace(tmp_path, _DISCOVERY_CACHE_FILE)
+        except Exception as e:
+            logger.warning(f"[PLUGIN] ⚠️ Failed to write discovery cache: {e}")
+    
+    def discover_plugins(self, use_cache: bool = False) -> List[Dict[str, Any]]:
+        """发现可用插件
+        
+        Args:
+            use_cache: 是否使用磁盘缓存的发现结果（缓存条目不包含'class'）
+        """
+        cache_key = None
+        if use_cache:
+            try:
+                cache_key = self._discovery_cache_key()
+            except OSError as e:
+                logger.warning(f"[PLUGIN] ⚠️ Failed to compute discovery cache key: {e}")
+            else:
+                cached_plugins = self._load_discovery_cache(cache_key)
+                if cached_plugins is not None:
+                    logger.info(f"🔍 Loaded {len(cached_plugins)} plugins from discovery cache")
+                    return cached_plugins
+        
         available_plugins = []
         
         try:
@@ -106,6 +236,9 @@ class PluginManager(QObject):
             
             logger.info(f"🔍 Discovered {len(available_plugins)} available plugins")
             
+            if cache_key is not None:
+                self._save_discovery_cache(cache_key, available_plugins)
+            
         except Exception as e:
             logger.error(f"❌ Error discovering plugins: {e} - {traceback.format_exc()}")
         
@@ -147,6 +280,10 @@ class PluginManager(QObject):
                     'has_local_config': (plugin_dir / "config.json").exists(),
                 })
                 
+                # 启动加载期间缓存已执行的模块，加载插件时无需再次执行
+                if self._collect_discovered_modules:
+                    self._discovered_modules[plugin_name] = module
+                
                 logger.info(f"[PLUGIN] 🔍 Plugin {plugin_name} discovered")
                 return plugin_info
                 
@@ -160,8 +297,12 @@ class PluginManager(QObject):
     
     def load_plugins(self):
         """加载所有启用的插件"""
-        # 发现所有可用插件
-        available_plugins = self.discover_plugins()
+        # 发现所有可用插件（启动时优先使用磁盘缓存）
+        self._collect_discovered_modules = True
+        try:
+            available_plugins = self.discover_plugins(use_cache=True)
+        finally:
+            self._collect_discovered_modules = False
         
         # 筛选出启用的插件
         enabled_plugins = []
@@ -171,12 +312,80 @@ class PluginManager(QObject):
         
         if not enabled_plugins:
             logger.info("[PLUGIN] 📦 No enabled plugins found")
+            self._discovered_modules.clear()
+            self.plugins_loaded.emit()
             return
         
         logger.info(f"[PLUGIN] 🚀 Loading {len(enabled_plugins)} enabled plugins: {', '.join(enabled_plugins)}")
         
-        for plugin_name in enabled_plugins:
-            self.load_plugin(plugin_name)
+        # 模块导入（磁盘读取、字节码加载）在线程池中并发执行，
+        # 插件实例化和界面注册仍在主线程中按原顺序进行
+        self._pending_plugins = enabled_plugins
+        to_import = [
+            plugin_name for plugin_name in enabled_plugins
+            if plugin_name not in self._discovered_modules and plugin_name not in self.plugins
+        ]
+        if not to_import:
+            self._finish_pending_plugins()
+            return
+        
+        self._pending_imports = len(to_import)
+        thread_pool = QThreadPool.globalInstance()
+        for plugin_name in to_import:
+            thread_pool.start(_PluginImportTask(self, plugin_name))
+    
+    def _on_plugin_module_imported(self, plugin_name: str, module: Any):
+        """后台导入完成（主线程），全部完成后按顺序加载插件"""
+        if module is not None:
+            self._discovered_modules[plugin_name] = module
+        self._pending_imports -= 1
+        if self._pending_imports == 0:
+            self._finish_pending_plugins()
+    
+    def _finish_pending_plugins(self):
+        """按启用顺序加载等待中的插件"""
+        pending_plugins, self._pending_plugins = self._pending_plugins, []
+        
+        # 批量添加插件按钮期间暂停重绘，只触发一次布局更新
+        main_window = None
+        if self.app and hasattr(self.app, 'get_main_window'):
+            main_window = self.app.get_main_window()
+        if main_window:
+            main_window.begin_bulk_add()
+        try:
+            for plugin_name in pending_plugins:
+                self.load_plugin(plugin_name)
+        finally:
+            if main_window:
+                main_window.end_bulk_add()
+        
+        # 未启用插件的模块不会再被复用，释放其引用
+        self._discovered_modules.clear()
+        self.plugins_loaded.emit()
+    
+    def _import_plugin_module(self, plugin_name: str) -> Optional[Any]:
+        """导入插件模块（不实例化插件类，可在工作线程中调用）"""
+        spec = importlib.util.spec_from_file_location(
+            f"plugins.{plugin_name}",
+            self.plugins_dir / plugin_name / "__init__.py"
+        )
+        
+        if spec is None or spec.loader is None:
+            return None
+        
+        module = importlib.util.module_from_spec(spec)
+        module_name = f"plugins.{plugin_name}"
+        
+        # 添加到sys.modules以支持相对导入
+        sys.modules[module_name] = module
+        
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            # 执行失败时移除半初始化的模块，避免后续导入拿到残缺模块
+            sys.modules.pop(module_name, None)
+            raise
+        return module
     
     def load_plugin(self, plugin_name: str) -> bool:
         """加载指定插件"""
@@ -190,22 +399,17 @@ class PluginManager(QObject):
                 logger.error(f"[PLUGIN] ❌ Plugin directory not found: {plugin_dir}")
                 return False
             
-            # 导入插件模块
-            spec = importlib.util.spec_from_file_location(
-                f"plugins.{plugin_name}",
-                plugin_dir / "__init__.py"
-            )
-            
-            if spec is None or spec.loader is None:
-                logger.error(f"[PLUGIN] ❌ Cannot load plugin module: {plugin_name}")
-                return False
-            
-            module = importlib.util.module_from_spec(spec)
-            
-            # 添加到sys.modules以支持相对导入
-            sys.modules[f"plugins.{plugin_name}"] = module
-            
-            spec.loader.exec_module(module)
+            # 优先复用发现阶段已执行的模块
+            module = self._discovered_modules.pop(plugin_name, None)
+            if module is not None:
+                # 添加到sys.modules以支持相对导入
+                sys.modules[f"plugins.{plugin_name}"] = module
+            else:
+                # 导入插件模块
+                module = self._import_plugin_module(plugin_name)
+                if module is None:
+                    logger.error(f"[PLUGIN] ❌ Cannot load plugin module: {plugin_name}")
+                    return False
             
             # 获取插件类
             plugin_class = getattr(module, 'Plugin', None)
@@ -304,8 +508,9 @@ class PluginManager(QObject):
         try:
             plugin = self.plugins[plugin_name]
             
-            # 清理插件
+            # 清理插件（子类重写cleanup时可能未调用基类实现，单独写入未保存的设置）
             plugin.cleanup()
+            plugin.flush_settings()
             
             # 从插件字典中移除
             del self.plugins[plugin_name]
@@ -376,6 +581,10 @@ class PluginManager(QObject):
         
         return True
     
+    def get_enabled_plugins(self) -> Set[str]:
+        """获取已启用插件名称集合（内存中维护，无需扫描插件目录）"""
+        return set(self.plugin_configs.get('enabled_plugins', []))
+    
     def get_plugin(self, plugin_name: str) -> Optional[PluginBase]:
         """获取插件实例"""
         return self.plugins.get(plugin_name)
@@ -432,10 +641,23 @@ class PluginManager(QObject):
                 self.plugin_configs['plugin_settings'][plugin_name] = {}
             
             self.plugin_configs['plugin_settings'][plugin_name][key] = value
+            
+            # 已加载的插件实例需丢弃缓存的设置值
+            plugin = self.plugins.get(plugin_name)
+            if plugin is not None:
+                plugin.invalidate_settings_cache()
             logger.debug(f"[PLUGIN] 💾 Setting {key} updated for plugin {plugin_name}")
         
         return success
     
+    def flush_all_settings(self):
+        """立即写入所有已加载插件尚未保存的设置变更"""
+        for plugin in list(self.plugins.values()):
+            try:
+                plugin.flush_settings()
+            except Exception as e:
+                logger.error(f"[PLUGIN] ❌ Failed to flush settings for {plugin.get_name()}: {e}")
+    
     def cleanup(self):
         """清理插件管理器"""
         logger.info("[PLUGIN] 🧹 Cleaning up plugin manager...")
@@ -457,19 +679,19 @@ class PluginManager(QObject):
                     continue
                 
                 config_file = plugin_dir / "config.json"
-                if config_file.exists():
-                    try:
-                        with open(config_file, 'r', encoding='utf-8') as f:
-                            config_data = json.load(f)
-                        
-                        # 检查插件是否启用
-                        available_config = config_data.get('available_config', {})
-                        if available_config.get('enabled', False):
-                            enabled_plugins.append(plugin_dir.name)
-                            logger.debug(f"[PLUGIN] ✅ Plugin {plugin_dir.name} is enabled")
+                try:
+                    config_data = json_loads(config_file.read_bytes())
                     
-                    except Exception as e:
-                        logger.warning(f"[PLUGIN] ⚠️ Failed to read config for {plugin_dir.name}: {e}")
+                    # 检查插件是否启用
+                    available_config = config_data.get('available_config', {})
+                    if available_config.get('enabled', False):
+                        enabled_plugins.append(plugin_dir.name)
+                        logger.debug(f"[PLUGIN] ✅ Plugin {plugin_dir.name} is enabled")
+                
+                except FileNotFoundError:
+                    continue
+                except Exception as e:
+                    logger.warning(f"[PLUGIN] ⚠️ Failed to read config for {plugin_dir.name}: {e}")
             
             self.plugin_configs['enabled_plugins'] = enabled_plugins
             logger.debug(f"[PLUGIN] 📋 Loaded {len(enabled_plugins)} enabled plugins from individual configs")
@@ -487,14 +709,19 @@ class PluginManager(QObject):
             
             config_file = plugin_dir / "config.json"
             
+            # 先写入插件尚未保存的设置变更，避免其延迟写入覆盖本次更新
+            plugin = self.plugins.get(plugin_name)
+            if plugin is not None:
+                plugin.flush_settings()
+            
             # 读取现有配置文件
             existing_config = {}
-            if config_file.exists():
-                try:
-                    with open(config_file, 'r', encoding='utf-8') as f:
-                        existing_config = json.load(f)
-                except Exception as e:
-                    logger.warning(f"[PLUGIN] ⚠️ Failed to read existing config for {plugin_name}: {e}")
+            try:
+                existing_config = json_loads(config_file.read_bytes())
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.warning(f"[PLUGIN] ⚠️ Failed to read existing config for {plugin_name}: {e}")
             
             # 只更新available_config部分
             if 'available_config' not in existing_config:
@@ -502,9 +729,14 @@ class PluginManager(QObject):
             
             existing_config['available_config'].update(new_config)
             
-            # 保存更新后的配置到插件的config.json文件
-            with open(config_file, 'w', encoding='utf-8') as f:
-                json.dump(existing_config, f, indent=2, ensure_ascii=False)
+            # 保存更新后的配置到插件的config.json文件（先写临时文件再原子替换，避免写入中断导致配置损坏）
+            tmp_file = config_file.with_name("config.json.tmp")
+            tmp_file.write_bytes(json_dumps(existing_config))
+            os.replace(tmp_file, config_file)
+            
+            # 已加载的插件实例需丢弃缓存的设置值
+            if plugin is not None:
+                plugin.invalidate_settings_cache()
             
             # 发射配置变更信号
             self.plugin_config_changed.emit(plugin_name, new_config)
@@ -8,18 +8,24 @@ import traceback
 
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QWidget, QScrollArea,
-    QPushButton, QLabel, QGroupBox, QTextEdit, QFrame, 
-    QMessageBox, QCheckBox, QSizePolicy, QLineEdit, QSpinBox, 
-    QComboBox, QFormLayout
+    QPushButton, QLabel, QFrame, QMessageBox, QCheckBox,
+    QLineEdit, QSpinBox, QComboBox, QFormLayout
 )
-from PySide6.QtCore import Qt, Signal, QSize, QEvent
-from PySide6.QtGui import QFont, QIcon, QPixmap, QKeySequence, QKeyEvent
+from PySide6.QtCore import Qt, Signal, QSize
+from PySide6.QtGui import QFont, QIcon, QKeySequence
 
 from utils.logger import logger
 from utils.crypto import encrypt_password, decrypt_password, is_password_field
 from .i18n import tr
 
 
+# 资源文件目录及对话框使用的图标路径
+_RESOURCES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "resources")
+_ICON_PATH = os.path.join(_RESOURCES_DIR, "icon.svg")
+_CONFIG_ICON_PATH = os.path.join(_RESOURCES_DIR, "plugin-config.png")
+_CONFIG_ICON_HOVER_PATH = os.path.join(_RESOURCES_DIR, "plugin-config-hovered.png")
+
+
 class KeyboardShortcutWidget(QWidget):
     """键盘快捷键输入控件"""
     
@@ -203,8 +209,8 @@ class PluginItemWidget(QFrame):
         self.config_button.setToolTip(tr("plugin_manager.config_tooltip"))
         
         # 设置图标路径
-        self.config_icon_normal = os.path.join(os.path.dirname(os.path.dirname(__file__)), "resources", "plugin-config.png")
-        self.config_icon_hover = os.path.join(os.path.dirname(os.path.dirname(__file__)), "resources", "plugin-config-hovered.png")
+        self.config_icon_normal = _CONFIG_ICON_PATH
+        self.config_icon_hover = _CONFIG_ICON_HOVER_PATH
         
         # 设置默认图标
         if os.path.exists(self.config_icon_normal):
@@ -362,9 +368,8 @@ class PluginConfigDialog(QDialog):
         self.resize(500, 400)
         
         # 设置窗口图标
-        icon_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "resources", "icon.svg")
-        if os.path.exists(icon_path):
-            self.setWindowIcon(QIcon(icon_path))
+        if os.path.exists(_ICON_PATH):
+            self.setWindowIcon(QIcon(_ICON_PATH))
         
         # 创建主布局
         main_layout = QVBoxLayout(self)
@@ -752,9 +757,8 @@ class PluginManagerDialog(QDialog):
         self.resize(500, 500)
         
         # 设置窗口图标
-        icon_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "resources", "icon.svg")
-        if os.path.exists(icon_path):
-            self.setWindowIcon(QIcon(icon_path))
+        if os.path.exists(_ICON_PATH):
+            self.setWindowIcon(QIcon(_ICON_PATH))
         
         # 创建主布局
         main_layout = QVBoxLayout(self)
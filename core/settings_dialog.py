@@ -3,24 +3,34 @@
 HSBC Little Worker - 设置对话框
 """
 
+import os
 import traceback
+from pathlib import Path
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QTabWidget,
     QWidget, QLabel, QComboBox, QPushButton, QGroupBox,
-    QCheckBox, QSlider, QSpinBox, QFormLayout, QDialogButtonBox
+    QSlider, QSpinBox, QFormLayout
 )
 from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QFont
 
 from utils.logger import logger
+from utils.json_utils import json_loads
 from .i18n import get_i18n_manager, tr
 
 
+# 应用配置文件路径
+_CONFIG_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "config",
+    "app_config.json"
+)
+
+
 class SettingsDialog(QDialog):
     """设置对话框"""
     
     # 信号定义
-    settings_changed = Signal()
+    settings_changed = Signal(dict)  # 设置变更信号，携带新的ui_settings
     
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -168,48 +178,21 @@ class SettingsDialog(QDialog):
     
     def _get_config_path(self):
         """获取配置文件路径"""
-        import os
-        return os.path.join(
-            os.path.dirname(os.path.dirname(__file__)), 
-            "config", 
-            "app_config.json"
-        )
+        return _CONFIG_PATH
     
     def _load_config(self):
         """加载配置文件"""
-        import os
-        import json
-        
         config_path = self._get_config_path()
         
-        if not os.path.exists(config_path):
+        try:
+            return json_loads(Path(config_path).read_bytes())
+        except FileNotFoundError:
             logger.warning("[SETTINGS] Config file not found, using default settings")
             return {}
-        
-        try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
         except Exception as e:
             logger.error(f"[SETTINGS] Failed to load config: {e} - {traceback.format_exc()}")
             return {}
     
-    def _save_config(self, config):
-        """保存配置文件"""
-        import os
-        import json
-        
-        try:
-            config_path = self._get_config_path()
-            os.makedirs(os.path.dirname(config_path), exist_ok=True)
-            
-            with open(config_path, 'w', encoding='utf-8') as f:
-                json.dump(config, f, ensure_ascii=False, indent=2)
-            
-            return True
-        except Exception as e:
-            logger.error(f"[SETTINGS] Failed to save config: {e} - {traceback.format_exc()}")
-            return False
-    
     def _load_settings(self):
         """加载当前设置"""
         try:
@@ -231,10 +214,9 @@ class SettingsDialog(QDialog):
             
             # 加载语言设置
             language = ui_settings.get("language", "en_US")
-            for i in range(self.language_combo.count()):
-                if self.language_combo.itemData(i) == language:
-                    self.language_combo.setCurrentIndex(i)
-                    break
+            index = self.language_combo.findData(language)
+            if index >= 0:
+                self.language_combo.setCurrentIndex(index)
             
 
             
@@ -247,41 +229,28 @@ class SettingsDialog(QDialog):
     def _apply_settings(self):
         """应用设置"""
         try:
-            # 读取现有配置
-            config = self._load_config()
-            
-            # 确保ui_settings存在
-            if "ui_settings" not in config:
-                config["ui_settings"] = {}
+            ui_settings = {}
             
             # 应用语言设置
             selected_language = self.language_combo.currentData()
             if selected_language:
                 self.i18n_manager.set_language(selected_language)
-                config["ui_settings"]["language"] = selected_language
+                ui_settings["language"] = selected_language
                 logger.info(f"[SETTINGS] 🌐 Language updated: {selected_language}")
             
             # 应用字体大小设置
             font_size = self.font_size_spinbox.value()
-            config["ui_settings"]["font_size"] = font_size
+            ui_settings["font_size"] = font_size
             logger.info(f"[SETTINGS] 🔤 Font size updated: {font_size}")
             
             # 应用透明度设置
             opacity = self.opacity_slider.value()
-            config["ui_settings"]["window_opacity"] = opacity / 100.0
-            if self.parent():
-                self.parent().setWindowOpacity(opacity / 100.0)
+            ui_settings["window_opacity"] = opacity / 100.0
             logger.info(f"[SETTINGS] 🔍 Window opacity updated: {opacity}%")
             
-
-            
-            # 保存配置到文件
-            if self._save_config(config):
-                # 发送设置变更信号
-                self.settings_changed.emit()
-                logger.info("[SETTINGS] ✅ Settings applied and saved")
-            else:
-                logger.error("[SETTINGS] ❌ Failed to save settings")
+            # 发送设置变更信号，由主程序应用并保存配置
+            self.settings_changed.emit(ui_settings)
+            logger.info("[SETTINGS] ✅ Settings applied")
             
         except Exception as e:
             logger.error(f"[SETTINGS] ❌ Failed to apply settings: {e} - {traceback.format_exc()}")
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+"""
+HSBC Little Worker - JSON Utilities
+Fast JSON encode/decode helpers, using orjson when it is installed
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the standard library
+    orjson = None
+
+
+def json_loads(data: Any) -> Any:
+    """
+    Parse JSON from bytes or str
+
+    Args:
+        data: Raw JSON document (bytes are decoded as UTF-8)
+
+    Returns:
+        Parsed Python object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded, 2-space indented JSON
+
+    Args:
+        obj: Object to serialize
+
+    Returns:
+        UTF-8 encoded JSON bytes, non-ASCII characters kept as-is
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')